@@ -9,7 +9,26 @@ import re
 from typing import List, Dict, Any
 from urllib.parse import quote_plus
 
-from scraper.adapters.base_adapter import BaseAdapter
+from bs4 import BeautifulSoup
+
+from scraper.adapters.base_adapter import BaseAdapter, HTML_PARSER
+from scraper.core.recipe_validator import is_jam_recipe
+
+# Regexes used on every page, compiled once
+RECIPE_LINK_PATTERN = re.compile(r'/recipe/\d+/')
+TITLE_CLASS_PATTERN = re.compile(r'title|heading|name')
+INTEGER_PATTERN = re.compile(r'\d+')
+
+# Serving patterns in priority order, with the unit each one reports
+SERVING_PATTERNS = (
+    (re.compile(r'Original recipe \(1X\) yields (\d+) servings', re.IGNORECASE), "servings"),
+    (re.compile(r'(\d+)\s+servings?', re.IGNORECASE), "servings"),
+    (re.compile(r'yields?\s+(\d+)\s+servings?', re.IGNORECASE), "servings"),
+    (re.compile(r'makes?\s+(\d+)\s+servings?', re.IGNORECASE), "servings"),
+    (re.compile(r'(\d+)\s+\d*oz?\s+jars?', re.IGNORECASE), "jars"),
+    (re.compile(r'(\d+)\s+jars?', re.IGNORECASE), "jars"),
+)
+SERVING_TEXT_PATTERN = re.compile(r'(\d+)\s+(servings?|jars?)', re.IGNORECASE)
 
 
 class AllRecipesAdapter(BaseAdapter):
@@ -51,13 +70,10 @@ class AllRecipesAdapter(BaseAdapter):
         Returns:
             List[str]: List of jam recipe URLs found on the search results page
         """
-        from bs4 import BeautifulSoup
-        import re
-        
-        soup = BeautifulSoup(search_results_html, 'html.parser')
+        soup = BeautifulSoup(search_results_html, HTML_PARSER)
         
         # Find all recipe cards/links
-        recipe_links = soup.find_all('a', href=re.compile(r'/recipe/\d+/'))
+        recipe_links = soup.find_all('a', href=RECIPE_LINK_PATTERN)
         
         jam_recipe_urls = []
         
@@ -75,7 +91,7 @@ class AllRecipesAdapter(BaseAdapter):
                 # Look for title in parent or sibling elements
                 parent = link.parent
                 if parent:
-                    title_elem = parent.find(['h3', 'h4', 'span'], class_=re.compile(r'title|heading|name'))
+                    title_elem = parent.find(['h3', 'h4', 'span'], class_=TITLE_CLASS_PATTERN)
                     if title_elem:
                         title = title_elem.get_text(strip=True)
             
@@ -100,10 +116,7 @@ class AllRecipesAdapter(BaseAdapter):
         Returns:
             Dict[str, Any]: Dictionary containing the extracted recipe data
         """
-        from bs4 import BeautifulSoup
-        import re
-        
-        soup = BeautifulSoup(recipe_html, 'html.parser')
+        soup = BeautifulSoup(recipe_html, HTML_PARSER)
         
         # Extract title
         title = self._extract_title(soup)
@@ -261,7 +274,7 @@ class AllRecipesAdapter(BaseAdapter):
         if review_elem:
             review_text = review_elem.get_text(strip=True)
             # Extract number from text like "(948)"
-            numbers = re.findall(r'\d+', review_text)
+            numbers = INTEGER_PATTERN.findall(review_text)
             if numbers:
                 try:
                     review_count = int(numbers[0])
@@ -295,30 +308,15 @@ class AllRecipesAdapter(BaseAdapter):
     
     def _extract_servings(self, soup) -> str:
         """Extract servings/yield information from HTML."""
-        import re
-        
         # Get all text from the page
         all_text = soup.get_text()
         
         # Look for clean serving patterns
-        serving_patterns = [
-            r'Original recipe \(1X\) yields (\d+) servings',
-            r'(\d+)\s+servings?',
-            r'yields?\s+(\d+)\s+servings?',
-            r'makes?\s+(\d+)\s+servings?',
-            r'(\d+)\s+\d*oz?\s+jars?',
-            r'(\d+)\s+jars?'
-        ]
-        
-        for pattern in serving_patterns:
-            matches = re.findall(pattern, all_text, re.IGNORECASE)
-            if matches:
+        for pattern, unit in SERVING_PATTERNS:
+            match = pattern.search(all_text)
+            if match:
                 # Return the first match with "servings" or "jars"
-                serving_count = matches[0]
-                if 'jar' in pattern.lower():
-                    return f"{serving_count} jars"
-                else:
-                    return f"{serving_count} servings"
+                return f"{match.group(1)} {unit}"
         
         # Fallback: look for serving information in specific elements
         serving_selectors = [
@@ -332,7 +330,7 @@ class AllRecipesAdapter(BaseAdapter):
             if serving_elem:
                 serving_text = serving_elem.get_text(strip=True)
                 # Clean up the text - look for just the serving number
-                serving_match = re.search(r'(\d+)\s+(servings?|jars?)', serving_text, re.IGNORECASE)
+                serving_match = SERVING_TEXT_PATTERN.search(serving_text)
                 if serving_match:
                     return f"{serving_match.group(1)} {serving_match.group(2)}"
         
@@ -400,5 +398,4 @@ class AllRecipesAdapter(BaseAdapter):
         Returns:
             bool: True if this is a jam recipe, False otherwise
         """
-        from scraper.core.recipe_validator import is_jam_recipe
         return is_jam_recipe(recipe_data)
@@ -9,6 +9,14 @@ the specific implementation details.
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any
 
+# Parser adapters pass to BeautifulSoup: the C-backed lxml parser when it is
+# installed, otherwise the pure-Python parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
 
 class BaseAdapter(ABC):
     """
@@ -5,16 +5,22 @@ BBC Good Food adapter for jam recipe scraping.
 This adapter scrapes jam recipes from BBC Good Food website.
 """
 
-import requests
 from bs4 import BeautifulSoup
 import json
 import re
 from typing import Dict, List, Any, Optional
 from urllib.parse import urljoin, urlparse
-import time
-import random
 
-from .base_adapter import BaseAdapter
+from .base_adapter import BaseAdapter, HTML_PARSER
+from scraper.core.recipe_validator import is_jam_recipe
+from scraper.fruit_mappings import extract_fruits_from_text
+
+# Numbers pulled out of rating, review and serving text, compiled once
+RATING_NUMBER_PATTERN = re.compile(r'(\d+\.?\d*)')
+INTEGER_PATTERN = re.compile(r'(\d+)')
+
+# Search result links to collection and category pages rather than recipes
+NON_RECIPE_LINK_PATTERN = re.compile(r'collection|category', re.IGNORECASE)
 
 class BBCGoodFoodAdapter(BaseAdapter):
     """Adapter for scraping BBC Good Food jam recipes."""
@@ -23,10 +29,6 @@ class BBCGoodFoodAdapter(BaseAdapter):
         super().__init__()
         self.base_url = "https://www.bbcgoodfood.com"
         self.search_url = "https://www.bbcgoodfood.com/search"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
     
     def search_for_fruit(self, fruit_name: str) -> str:
         """Generate search URL for fruit."""
@@ -35,8 +37,9 @@ class BBCGoodFoodAdapter(BaseAdapter):
     
     def get_recipe_urls(self, search_results_html: str) -> List[str]:
         """Extract recipe URLs from search results, filtering out collection pages."""
-        soup = BeautifulSoup(search_results_html, 'html.parser')
+        soup = BeautifulSoup(search_results_html, HTML_PARSER)
         urls = []
+        seen_urls = set()
         
         # Look for recipe links
         recipe_links = soup.select('a[href*="/recipes/"]')
@@ -44,12 +47,13 @@ class BBCGoodFoodAdapter(BaseAdapter):
             href = link.get('href')
             if href and '/recipes/' in href:
                 # Filter out collection and category pages
-                if any(keyword in href.lower() for keyword in ['collection', 'category']):
+                if NON_RECIPE_LINK_PATTERN.search(href):
                     continue
                     
                 # Only include individual recipe pages
                 full_url = urljoin(self.base_url, href)
-                if full_url not in urls:
+                if full_url not in seen_urls:
+                    seen_urls.add(full_url)
                     urls.append(full_url)
         
         print(f"Found {len(urls)} individual recipe URLs (filtered out collection pages)")
@@ -57,7 +61,7 @@ class BBCGoodFoodAdapter(BaseAdapter):
     
     def extract_recipe_data(self, recipe_html: str, recipe_url: str) -> Dict[str, Any]:
         """Extract recipe data from HTML."""
-        soup = BeautifulSoup(recipe_html, 'html.parser')
+        soup = BeautifulSoup(recipe_html, HTML_PARSER)
         
         # Extract all recipe data
         recipe_data = {
@@ -226,7 +230,7 @@ class BBCGoodFoodAdapter(BaseAdapter):
             if rating_elem:
                 rating_text = rating_elem.get_text(strip=True)
                 # Extract number from text
-                rating_match = re.search(r'(\d+\.?\d*)', rating_text)
+                rating_match = RATING_NUMBER_PATTERN.search(rating_text)
                 if rating_match:
                     return float(rating_match.group(1))
         
@@ -265,7 +269,7 @@ class BBCGoodFoodAdapter(BaseAdapter):
             if review_elem:
                 review_text = review_elem.get_text(strip=True)
                 # Extract number from text
-                review_match = re.search(r'(\d+)', review_text)
+                review_match = INTEGER_PATTERN.search(review_text)
                 if review_match:
                     return int(review_match.group(1))
         
@@ -328,7 +332,7 @@ class BBCGoodFoodAdapter(BaseAdapter):
             if serving_elem:
                 serving_text = serving_elem.get_text(strip=True)
                 # Extract number from text
-                serving_match = re.search(r'(\d+)', serving_text)
+                serving_match = INTEGER_PATTERN.search(serving_text)
                 if serving_match:
                     return int(serving_match.group(1))
         
@@ -345,7 +349,6 @@ class BBCGoodFoodAdapter(BaseAdapter):
         Returns:
             bool: True if this appears to be a jam recipe
         """
-        from scraper.core.recipe_validator import is_jam_recipe
         return is_jam_recipe(recipe_data)
     
     def extract_fruits_from_ingredients(self, ingredients: List[Dict[str, str]]) -> List[str]:
@@ -358,8 +361,6 @@ class BBCGoodFoodAdapter(BaseAdapter):
         Returns:
             List of fruit AI names found in ingredients
         """
-        from scraper.fruit_mappings import extract_fruits_from_text
-        
         fruits = set()
         for ingredient in ingredients:
             ingredient_text = ingredient.get('name', '')
@@ -413,8 +414,7 @@ class BBCGoodFoodAdapter(BaseAdapter):
                         return int(yield_data)
                     elif isinstance(yield_data, str):
                         # Extract number from string like "Makes 3-4 jars"
-                        import re
-                        match = re.search(r'(\d+)', yield_data)
+                        match = INTEGER_PATTERN.search(yield_data)
                         if match:
                             return int(match.group(1))
         except (json.JSONDecodeError, KeyError, TypeError, ValueError):
@@ -5,17 +5,174 @@ Food Network adapter for recipe scraping.
 This adapter handles recipe extraction from Food Network website.
 """
 
-import json
+import hashlib
+import html
+import logging
 import re
-from typing import List, Dict, Any
-from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
+from urllib.parse import quote_plus
+from bs4 import BeautifulSoup, SoupStrainer
+
+from scraper.adapters.base_adapter import BaseAdapter, HTML_PARSER
+from scraper.core.recipe_validator import has_jam_keyword, is_jam_recipe
+from scraper.core.selector_groups import compile_selector_group, select_by_priority
+from scraper.fruit_mappings import extract_fruits_from_text
+
+logger = logging.getLogger(__name__)
+
+# lxml's own parser is used directly for the JSON-LD fast path when available
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+# Prefer the Rust-backed orjson parser for JSON-LD, falling back to stdlib json
+try:
+    import orjson as json_parser
+except ImportError:
+    import json as json_parser
+
+# Food Network UK search URL format (working better than US site)
+SEARCH_URL = "https://foodnetwork.co.uk/search?q={}"
+
+# Base for relative recipe links found in search results
+SITE_URL = "https://www.foodnetwork.com"
+
+# Pre-compiled patterns used on every scraped page
+# (any slug under /recipes/, which covers the '-recipe' and '-recipes' variants;
+# the bare /recipes/ listing page is not a recipe)
+RECIPE_URL_PATTERN = re.compile(r'/recipes/.+')
+INTEGER_PATTERN = re.compile(r'\d+')
+DECIMAL_PATTERN = re.compile(r'\d+\.\d+')
+PAREN_INTEGER_PATTERN = re.compile(r'\((\d+)\)')
+# Step separators: newlines, and <BR> tags that legacy content carries as
+# escaped text (so they survive get_text() as literal '<BR>')
+INSTRUCTION_SPLIT_PATTERN = re.compile(r'\s*(?:\n|<br\s*/?>)\s*', re.IGNORECASE)
+
+# Recipe fields the JSON-LD fast path leaves as None when absent, to be read
+# from the HTML page instead
+JSON_LD_OPTIONAL_FIELDS = ('servings', 'image_url', 'description')
+
+# <a href="..."> values pointing under /recipes/, read straight from raw HTML.
+# Quoted attribute values are skipped whole (they may contain '>'), and href
+# must not be the tail of another attribute name such as data-href.
+RECIPE_HREF_PATTERN = re.compile(
+    r'''<a\s(?:[^>"']|"[^"]*"|'[^']*')*?(?<![\w-])href\s*=\s*'''
+    r'''(?:"([^"]*/recipes/[^"]*)"|'([^']*/recipes/[^']*)')''',
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=4096)
+def is_recipe_url(url: str) -> bool:
+    """
+    Check if URL is a recipe page.
+    
+    Results are cached since search pages repeat the same links.
+    
+    Args:
+        url (str): URL to check
+        
+    Returns:
+        bool: True if URL appears to be a recipe
+    """
+    return bool(RECIPE_URL_PATTERN.search(url))
+
+
+# Process-wide LRU cache of parsed JSON-LD Recipe objects, keyed by a digest
+# of the page HTML, so retried or re-visited pages are not parsed again
+JSON_LD_CACHE_SIZE = 256
+json_ld_cache: "OrderedDict[bytes, Optional[Dict[str, Any]]]" = OrderedDict()
+json_ld_cache_lock = threading.Lock()
+
+# Only build <a href> nodes when parsing search results
+RECIPE_LINK_STRAINER = SoupStrainer('a', href=True)
+
+# Only build JSON-LD <script> nodes when lxml is unavailable for XPath
+JSON_LD_STRAINER = SoupStrainer('script', type='application/ld+json')
+
+# Recipe link selectors, most preferred first. Only <a> elements exist in the
+# strained tree, so container-scoped selectors ('.recipe-card a') cannot match.
+RECIPE_LINK_SELECTORS = compile_selector_group([
+    'a[href*="/recipes/"]',  # Links containing /recipes/
+    'a[data-testid*="recipe"]',  # Data attribute recipe links
+    'a[href*="recipe"]',    # Any link containing "recipe"
+])
+
+# Food Network UK field selectors, most preferred first
+TITLE_SELECTORS = compile_selector_group([
+    'h1.p-name',  # Microdata title
+    'h1.recipe-title',
+    'h1[data-testid="recipe-title"]',
+    '.recipe-title',
+    'h1',
+])
+
+INGREDIENT_SELECTORS = compile_selector_group([
+    '.p-ingredient',  # Microdata ingredients
+    '.o-Ingredients__a-ListItem',
+    '.ingredient',
+    '.recipe-ingredients li',
+    '.ingredients li',
+    '[data-testid="ingredient"]',
+])
+
+INSTRUCTION_SELECTORS = compile_selector_group([
+    '.e-instructions',  # Microdata instructions
+    '.legacy-method.content',
+    '.o-Method__m-Body p',
+    '.recipe-instructions p',
+    '.directions p',
+    '.instructions p',
+    '[data-testid="instruction"]',
+])
+
+SERVING_SELECTORS = compile_selector_group([
+    '.o-RecipeInfo__m-Yield',
+    '.recipe-yield',
+    '.servings',
+    '[data-testid="servings"]',
+])
+
+IMAGE_SELECTORS = compile_selector_group([
+    '.recipe-image img',
+    '.hero-image img',
+    '.recipe-photo img',
+    'img[data-testid="recipe-image"]',
+])
+
+DESCRIPTION_SELECTORS = compile_selector_group([
+    # Food Network UK specific selectors (most likely to work)
+    '.p-summary',  # Microdata summary class
+    'p.summary',
+    '.recipe-info p',
+    '.recipe-details p',
+    '.summary p',
+    # Generic selectors
+    '.recipe-description',
+    '.recipe-summary',
+    '.description',
+    '[data-testid="description"]',
+])
 
-from scraper.adapters.base_adapter import BaseAdapter
 
 class FoodNetworkAdapter(BaseAdapter):
     """Adapter for Food Network recipe scraping."""
     
+    def __init__(self, scan_links_with_regex: bool = True):
+        """
+        Initialize the Food Network adapter.
+        
+        Args:
+            scan_links_with_regex (bool): Read recipe links from the raw search
+                HTML with a regex, only parsing the page when that finds nothing.
+                Disable if the site's markup stops matching the pattern.
+        """
+        self.scan_links_with_regex = scan_links_with_regex
+    
     def get_site_name(self) -> str:
         """Return the name of the site this adapter scrapes."""
         return "Food Network"
@@ -34,10 +191,7 @@ class FoodNetworkAdapter(BaseAdapter):
         Returns:
             str: The search URL
         """
-        # Food Network UK search URL format (working better than US site)
-        search_query = f"{fruit_name} jam"
-        encoded_query = search_query.replace(" ", "%20")
-        return f"https://foodnetwork.co.uk/search?q={encoded_query}"
+        return SEARCH_URL.format(quote_plus(f"{fruit_name} jam"))
     
     def get_recipe_urls(self, search_results_html: str) -> List[str]:
         """
@@ -50,87 +204,165 @@ class FoodNetworkAdapter(BaseAdapter):
         Returns:
             List[str]: List of recipe URLs
         """
-        soup = BeautifulSoup(search_results_html, 'html.parser')
-        recipe_urls = []
+        hrefs = self._scan_recipe_hrefs(search_results_html) if self.scan_links_with_regex else []
+        if not hrefs:
+            hrefs = self._select_recipe_hrefs(search_results_html)
         
-        # Food Network recipe link selectors (to be determined)
-        # Common selectors for recipe links
-        recipe_selectors = [
-            'a[href*="/recipes/"]',  # Links containing /recipes/
-            '.recipe-card a',       # Recipe card links
-            '.search-result a',     # Search result links
-            'a[data-testid*="recipe"]',  # Data attribute recipe links
-            'a[href*="recipe"]',    # Any link containing "recipe"
-        ]
-        
-        for selector in recipe_selectors:
-            links = soup.select(selector)
-            if links:
-                print(f"✅ Found {len(links)} recipe links using selector: {selector}")
-                break
-        
-        if not links:
-            print("❌ No recipe links found with any selector")
+        if not hrefs:
+            logger.warning("No recipe links found with any selector")
             return []
         
-        for link in links:
+        logger.debug("Found %d recipe links", len(hrefs))
+        
+        recipe_urls = []
+        for href in dict.fromkeys(hrefs):
             if len(recipe_urls) >= 10:
                 break
-                
-            href = link.get('href')
-            if not href:
-                continue
             
-            # Convert relative URLs to absolute
-            if href.startswith('/'):
-                href = urljoin('https://www.foodnetwork.com', href)
+            # Convert relative URLs to absolute (plain concatenation is enough
+            # for protocol- and path-relative links, no need for urljoin)
+            if href.startswith('//'):
+                href = 'https:' + href
+            elif href.startswith('/'):
+                href = SITE_URL + href
             
             # Filter for actual recipe URLs
-            if self._is_recipe_url(href):
+            if is_recipe_url(href):
                 recipe_urls.append(href)
-                print(f"Found recipe: {href}")
         
+        logger.debug("Found %d recipes: %s", len(recipe_urls), recipe_urls)
         return recipe_urls[:10]
     
-    def _is_recipe_url(self, url: str) -> bool:
+    def _scan_recipe_hrefs(self, search_results_html: str) -> List[str]:
+        """Read /recipes/ link targets straight from the raw search HTML."""
+        return [
+            html.unescape(match.group(1) or match.group(2))
+            for match in RECIPE_HREF_PATTERN.finditer(search_results_html)
+        ]
+    
+    def _select_recipe_hrefs(self, search_results_html: str) -> List[str]:
+        """Parse the search page's links and return the best-matching hrefs."""
+        soup = BeautifulSoup(search_results_html, HTML_PARSER, parse_only=RECIPE_LINK_STRAINER)
+        links = next(select_by_priority(soup, RECIPE_LINK_SELECTORS), [])
+        return [link.get('href') for link in links if link.get('href')]
+    
+    def extract_recipe_data(self, recipe_html: str, recipe_url: str) -> Dict[str, Any]:
         """
-        Check if URL is a recipe page.
+        Extract recipe data from Food Network recipe page.
         
         Args:
-            url (str): URL to check
+            recipe_html (str): HTML content of recipe page
+            recipe_url (str): URL of the recipe
             
         Returns:
-            bool: True if URL appears to be a recipe
+            Dict[str, Any]: Extracted recipe data
         """
-        # Food Network recipe URL patterns
-        recipe_patterns = [
-            r'/recipes/.*-recipe',
-            r'/recipes/.*-recipes',
-            r'/recipes/.*',
-        ]
+        # Food Network UK pages ship a JSON-LD Recipe object; when it is
+        # complete the HTML tree never needs to be built
+        recipe_json_ld = self._load_recipe_json_ld(recipe_html)
+        recipe_data = self._extract_from_json_ld(recipe_json_ld, recipe_url) if recipe_json_ld else None
+        
+        if recipe_data is None:
+            soup = BeautifulSoup(recipe_html, HTML_PARSER)
+            recipe_data = self._extract_from_html(soup, recipe_json_ld, recipe_url)
+        elif any(recipe_data[field] is None for field in JSON_LD_OPTIONAL_FIELDS):
+            # Servings, image or description missing from JSON-LD: read them
+            # from the page, as the HTML path would
+            soup = BeautifulSoup(recipe_html, HTML_PARSER)
+            if recipe_data['servings'] is None:
+                recipe_data['servings'] = self._extract_servings(soup)
+            if recipe_data['image_url'] is None:
+                recipe_data['image_url'] = self._extract_image_url(soup)
+            if recipe_data['description'] is None:
+                recipe_data['description'] = self._extract_description(soup)
+        
+        title = recipe_data['title']
+        description = recipe_data['description']
+        ingredients = recipe_data['ingredients']
         
-        for pattern in recipe_patterns:
-            if re.search(pattern, url):
-                return True
+        # Validate that this is actually a jam recipe
+        if not self._is_jam_recipe(recipe_data):
+            print(f"⚠️  Recipe '{title}' failed jam validation:")
+            print(f"    Title: {title}")
+            print(f"    Description: {description[:100]}...")
+            print(f"    Ingredients count: {len(ingredients)}")
+            if ingredients:
+                print(f"    First ingredient: {ingredients[0]}")
+            raise ValueError(f"Recipe '{title}' is not a jam recipe")
         
-        return False
+        return recipe_data
     
-    def extract_recipe_data(self, recipe_html: str, recipe_url: str) -> Dict[str, Any]:
+    def _extract_from_json_ld(self, recipe_json_ld: Dict[str, Any], recipe_url: str) -> Optional[Dict[str, Any]]:
         """
-        Extract recipe data from Food Network recipe page.
+        Build recipe data from the JSON-LD Recipe object alone.
         
         Args:
-            recipe_html (str): HTML content of recipe page
+            recipe_json_ld (Dict[str, Any]): JSON-LD Recipe object
             recipe_url (str): URL of the recipe
             
         Returns:
-            Dict[str, Any]: Extracted recipe data
+            Optional[Dict[str, Any]]: Extracted recipe data, or None when the
+            title, ingredients, instructions or rating are missing and the
+            HTML page has to be parsed instead. Servings, image_url and
+            description are None when the JSON-LD lacks them.
         """
-        soup = BeautifulSoup(recipe_html, 'html.parser')
+        # JSON-LD strings keep HTML entities (&amp;), which the HTML path's
+        # get_text() would have decoded
+        title = recipe_json_ld.get('name')
+        if not isinstance(title, str) or not html.unescape(title).strip():
+            return None
+        
+        ingredients_data = recipe_json_ld.get('recipeIngredient')
+        if not isinstance(ingredients_data, list):
+            return None
+        ingredients = [html.unescape(str(ingredient)).strip() for ingredient in ingredients_data]
+        ingredients = [ingredient for ingredient in ingredients if ingredient]
+        
+        instructions = self._json_ld_instructions(recipe_json_ld.get('recipeInstructions'))
+        rating, review_count = self._json_ld_rating_info(recipe_json_ld)
+        if not ingredients or not instructions or rating == 0.0:
+            return None
+        
+        description = recipe_json_ld.get('description')
+        
+        return {
+            'title': html.unescape(title).strip(),
+            'ingredients': ingredients,
+            'instructions': instructions,
+            'servings': self._json_ld_servings(recipe_json_ld),
+            'rating': rating,
+            'review_count': review_count,
+            'image_url': self._json_ld_image_url(recipe_json_ld),
+            'description': html.unescape(description) if isinstance(description, str) else None,
+            'source_url': recipe_url
+        }
+    
+    def _extract_from_html(self, soup: BeautifulSoup, recipe_json_ld: Optional[Dict[str, Any]], recipe_url: str) -> Dict[str, Any]:
+        """
+        Build recipe data from the HTML page, using any partial JSON-LD first.
         
+        Args:
+            soup (BeautifulSoup): Parsed recipe page
+            recipe_json_ld (Optional[Dict[str, Any]]): JSON-LD Recipe object, if any
+            recipe_url (str): URL of the recipe
+            
+        Returns:
+            Dict[str, Any]: Extracted recipe data
+            
+        Raises:
+            ValueError: If the title and description rule out a jam recipe
+        """
         # Extract title
         title = self._extract_title(soup)
         
+        # Extract description
+        description = self._extract_description(soup, recipe_json_ld)
+        
+        # Reject non-jam pages before extracting everything else
+        if not has_jam_keyword(title, description):
+            print(f"⚠️  Recipe '{title}' failed jam validation: no jam keyword in title or description")
+            raise ValueError(f"Recipe '{title}' is not a jam recipe")
+        
         # Extract ingredients
         ingredients = self._extract_ingredients(soup)
         
@@ -138,20 +370,15 @@ class FoodNetworkAdapter(BaseAdapter):
         instructions = self._extract_instructions(soup)
         
         # Extract servings
-        servings = self._extract_servings(soup)
-        
-        # Extract time info
+        servings = self._extract_servings(soup, recipe_json_ld)
         
         # Extract rating and review count
-        rating, review_count = self._extract_rating_info(soup)
+        rating, review_count = self._extract_rating_info(soup, recipe_json_ld)
         
         # Extract image URL
-        image_url = self._extract_image_url(soup)
-        
-        # Extract description
-        description = self._extract_description(soup)
+        image_url = self._extract_image_url(soup, recipe_json_ld)
         
-        recipe_data = {
+        return {
             'title': title,
             'ingredients': ingredients,
             'instructions': instructions,
@@ -162,34 +389,164 @@ class FoodNetworkAdapter(BaseAdapter):
             'description': description,
             'source_url': recipe_url
         }
+    
+    def _find_json_ld_blocks(self, recipe_html: str) -> List[str]:
+        """
+        Return the contents of every JSON-LD script on the page.
         
-        # Validate that this is actually a jam recipe
-        if not self._is_jam_recipe(recipe_data):
-            print(f"⚠️  Recipe '{title}' failed jam validation:")
-            print(f"    Title: {title}")
-            print(f"    Description: {description[:100]}...")
-            print(f"    Ingredients count: {len(ingredients)}")
-            if ingredients:
-                print(f"    First ingredient: {ingredients[0]}")
-            raise ValueError(f"Recipe '{title}' is not a jam recipe")
+        Uses a single lxml XPath query when lxml is available, which avoids
+        building a BeautifulSoup tree for the most frequent lookup.
         
-        return recipe_data
+        Args:
+            recipe_html (str): HTML content of recipe page
+            
+        Returns:
+            List[str]: Raw JSON text of each JSON-LD script, as plain str
+            (orjson rejects the str subclasses lxml and BeautifulSoup return)
+        """
+        if etree is not None:
+            try:
+                tree = etree.HTML(recipe_html)
+            except ValueError:
+                tree = None
+            if tree is not None:
+                return [str(text) for text in tree.xpath('//script[@type="application/ld+json"]/text()')]
+        
+        soup = BeautifulSoup(recipe_html, HTML_PARSER, parse_only=JSON_LD_STRAINER)
+        return [str(script.string) for script in soup.find_all('script') if script.string is not None]
+    
+    def _load_recipe_json_ld(self, recipe_html: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the JSON-LD Recipe object on the page.
+        
+        Results are cached process-wide, so the returned object is shared and
+        must be treated as read-only.
+        
+        Args:
+            recipe_html (str): HTML content of recipe page
+            
+        Returns:
+            Optional[Dict[str, Any]]: The first Recipe object found, or None
+        """
+        cache_key = hashlib.blake2b(recipe_html.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        with json_ld_cache_lock:
+            if cache_key in json_ld_cache:
+                json_ld_cache.move_to_end(cache_key)
+                return json_ld_cache[cache_key]
+        
+        recipe_json_ld = self._parse_recipe_json_ld(recipe_html)
+        
+        with json_ld_cache_lock:
+            json_ld_cache[cache_key] = recipe_json_ld
+            if len(json_ld_cache) > JSON_LD_CACHE_SIZE:
+                json_ld_cache.popitem(last=False)
+        
+        return recipe_json_ld
+    
+    def _parse_recipe_json_ld(self, recipe_html: str) -> Optional[Dict[str, Any]]:
+        """Parse the page's JSON-LD scripts and return the first Recipe object."""
+        for json_ld_text in self._find_json_ld_blocks(recipe_html):
+            # Skip breadcrumb/organisation/website blocks without parsing them
+            if '"Recipe"' not in json_ld_text:
+                continue
+            
+            try:
+                data = json_parser.loads(json_ld_text)
+            except (ValueError, TypeError):
+                continue
+            
+            # Structured data may be a single object, a list, or an @graph
+            if isinstance(data, dict) and '@graph' in data:
+                data = data['@graph']
+            candidates = data if isinstance(data, list) else [data]
+            
+            for candidate in candidates:
+                if isinstance(candidate, dict) and self._is_recipe_type(candidate.get('@type')):
+                    return candidate
+        
+        return None
+    
+    def _is_recipe_type(self, schema_type: Any) -> bool:
+        """Check whether a JSON-LD @type value denotes a Recipe."""
+        if isinstance(schema_type, list):
+            return 'Recipe' in schema_type
+        return schema_type == 'Recipe'
+    
+    def _json_ld_instructions(self, instructions_data: Any) -> List[str]:
+        """
+        Flatten JSON-LD recipeInstructions into a list of steps.
+        
+        Handles plain text, lists of strings, HowToStep objects and
+        HowToSection objects (whose steps are under itemListElement). Entities
+        are decoded and steps split on newlines and <br> tags, as on the HTML path.
+        """
+        if isinstance(instructions_data, str):
+            text = html.unescape(instructions_data).strip()
+            return [part for part in INSTRUCTION_SPLIT_PATTERN.split(text) if part]
+        
+        steps = []
+        if isinstance(instructions_data, list):
+            for step in instructions_data:
+                if isinstance(step, dict):
+                    step = step.get('itemListElement') or step.get('text')
+                steps.extend(self._json_ld_instructions(step))
+        return steps
+    
+    def _json_ld_servings(self, recipe_json_ld: Dict[str, Any]) -> Optional[int]:
+        """Read the number of servings from JSON-LD recipeYield, if present."""
+        try:
+            yield_value = recipe_json_ld.get('recipeYield')
+            if isinstance(yield_value, (int, float)):
+                return int(yield_value)
+            elif isinstance(yield_value, str):
+                # Extract number from text like "8" or "8 jars"
+                numbers = INTEGER_PATTERN.findall(yield_value)
+                if numbers:
+                    return int(numbers[0])
+        except (ValueError, TypeError):
+            pass
+        return None
+    
+    def _json_ld_rating_info(self, recipe_json_ld: Dict[str, Any]) -> tuple:
+        """Read rating and review count from JSON-LD aggregateRating."""
+        rating = 0.0
+        review_count = 0
+        
+        agg_rating = recipe_json_ld.get('aggregateRating')
+        if isinstance(agg_rating, dict):
+            if 'ratingValue' in agg_rating:
+                try:
+                    rating = float(agg_rating['ratingValue'])
+                except (ValueError, TypeError):
+                    pass
+            if 'ratingCount' in agg_rating:
+                try:
+                    review_count = int(agg_rating['ratingCount'])
+                except (ValueError, TypeError):
+                    pass
+        
+        return rating, review_count
+    
+    def _json_ld_image_url(self, recipe_json_ld: Dict[str, Any]) -> Optional[str]:
+        """Read the image URL from JSON-LD image or associatedMedia, if present."""
+        image_data = recipe_json_ld.get('image')
+        if isinstance(image_data, list) and image_data:
+            image_data = image_data[0]
+        if isinstance(image_data, str):
+            return image_data
+        elif isinstance(image_data, dict) and 'contentUrl' in image_data:
+            return image_data['contentUrl']
+        
+        media_data = recipe_json_ld.get('associatedMedia')
+        if isinstance(media_data, dict) and 'contentUrl' in media_data:
+            return media_data['contentUrl']
+        
+        return None
     
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """Extract recipe title."""
-        # Food Network UK title selectors
-        title_selectors = [
-            'h1.p-name',  # Microdata title
-            'h1.recipe-title',
-            'h1[data-testid="recipe-title"]',
-            '.recipe-title',
-            'h1',
-        ]
-        
-        for selector in title_selectors:
-            title_elem = soup.select_one(selector)
-            if title_elem:
-                return title_elem.get_text().strip()
+        for title_elems in select_by_priority(soup, TITLE_SELECTORS):
+            return title_elems[0].get_text().strip()
         
         return "Unknown Recipe"
     
@@ -197,21 +554,9 @@ class FoodNetworkAdapter(BaseAdapter):
         """Extract recipe ingredients."""
         ingredients = []
         
-        # Food Network UK ingredient selectors
-        ingredient_selectors = [
-            '.p-ingredient',  # Microdata ingredients
-            '.o-Ingredients__a-ListItem',
-            '.ingredient',
-            '.recipe-ingredients li',
-            '.ingredients li',
-            '[data-testid="ingredient"]',
-        ]
-        
-        for selector in ingredient_selectors:
-            ingredient_elems = soup.select(selector)
-            if ingredient_elems:
-                ingredients = [elem.get_text().strip() for elem in ingredient_elems]
-                break
+        for ingredient_elems in select_by_priority(soup, INGREDIENT_SELECTORS):
+            ingredients = [elem.get_text().strip() for elem in ingredient_elems]
+            break
         
         return ingredients
     
@@ -219,107 +564,44 @@ class FoodNetworkAdapter(BaseAdapter):
         """Extract recipe instructions."""
         instructions = []
         
-        # Food Network UK instruction selectors
-        instruction_selectors = [
-            '.e-instructions',  # Microdata instructions
-            '.legacy-method.content',
-            '.o-Method__m-Body p',
-            '.recipe-instructions p',
-            '.directions p',
-            '.instructions p',
-            '[data-testid="instruction"]',
-        ]
-        
-        for selector in instruction_selectors:
-            instruction_elems = soup.select(selector)
-            if instruction_elems:
-                # Split instructions by <BR> tags or newlines
-                for elem in instruction_elems:
-                    text = elem.get_text().strip()
-                    if text:
-                        # Split by <BR> tags or multiple newlines
-                        parts = text.replace('<BR>', '\n').split('\n')
-                        for part in parts:
-                            part = part.strip()
-                            if part:
-                                instructions.append(part)
-                if instructions:
-                    break
+        for instruction_elems in select_by_priority(soup, INSTRUCTION_SELECTORS):
+            # Split instructions into one step per non-blank line
+            for elem in instruction_elems:
+                text = elem.get_text().strip()
+                if text:
+                    instructions.extend(part for part in INSTRUCTION_SPLIT_PATTERN.split(text) if part)
+            if instructions:
+                break
         
         return instructions
     
-    def _extract_servings(self, soup: BeautifulSoup) -> int:
+    def _extract_servings(self, soup: BeautifulSoup, recipe_json_ld: Optional[Dict[str, Any]] = None) -> int:
         """Extract number of servings from JSON-LD structured data."""
-        # Look for JSON-LD structured data first (most reliable)
-        json_ld_scripts = soup.find_all('script', type='application/ld+json')
-        for script in json_ld_scripts:
-            try:
-                data = json.loads(script.string)
-                if isinstance(data, dict) and data.get('@type') == 'Recipe':
-                    # Check for recipeYield field
-                    if 'recipeYield' in data:
-                        try:
-                            yield_value = data['recipeYield']
-                            if isinstance(yield_value, (int, float)):
-                                return int(yield_value)
-                            elif isinstance(yield_value, str):
-                                # Extract number from text like "8" or "8 jars"
-                                numbers = re.findall(r'\d+', yield_value)
-                                if numbers:
-                                    return int(numbers[0])
-                        except (ValueError, TypeError):
-                            pass
-                    break
-            except (json.JSONDecodeError, TypeError):
-                continue
+        # Use JSON-LD structured data first (most reliable)
+        if recipe_json_ld:
+            servings = self._json_ld_servings(recipe_json_ld)
+            if servings is not None:
+                return servings
         
         # Fallback to HTML selectors if JSON-LD didn't work
-        serving_selectors = [
-            '.o-RecipeInfo__m-Yield',
-            '.recipe-yield',
-            '.servings',
-            '[data-testid="servings"]',
-        ]
-        
-        for selector in serving_selectors:
-            serving_elem = soup.select_one(selector)
-            if serving_elem:
-                serving_text = serving_elem.get_text().strip()
-                # Extract number from text like "Serves 4" or "4 servings"
-                numbers = re.findall(r'\d+', serving_text)
-                if numbers:
-                    return int(numbers[0])
+        for serving_elems in select_by_priority(soup, SERVING_SELECTORS):
+            serving_text = serving_elems[0].get_text().strip()
+            # Extract number from text like "Serves 4" or "4 servings"
+            numbers = INTEGER_PATTERN.findall(serving_text)
+            if numbers:
+                return int(numbers[0])
         
         return 0
     
     
-    def _extract_rating_info(self, soup: BeautifulSoup) -> tuple:
+    def _extract_rating_info(self, soup: BeautifulSoup, recipe_json_ld: Optional[Dict[str, Any]] = None) -> tuple:
         """Extract rating and review count from JSON-LD structured data."""
         rating = 0.0
         review_count = 0
         
-        # Look for JSON-LD structured data first (most reliable)
-        json_ld_scripts = soup.find_all('script', type='application/ld+json')
-        for script in json_ld_scripts:
-            try:
-                data = json.loads(script.string)
-                if isinstance(data, dict) and data.get('@type') == 'Recipe':
-                    if 'aggregateRating' in data:
-                        agg_rating = data['aggregateRating']
-                        if isinstance(agg_rating, dict):
-                            if 'ratingValue' in agg_rating:
-                                try:
-                                    rating = float(agg_rating['ratingValue'])
-                                except (ValueError, TypeError):
-                                    pass
-                            if 'ratingCount' in agg_rating:
-                                try:
-                                    review_count = int(agg_rating['ratingCount'])
-                                except (ValueError, TypeError):
-                                    pass
-                    break
-            except (json.JSONDecodeError, TypeError):
-                continue
+        # Use JSON-LD structured data first (most reliable)
+        if recipe_json_ld:
+            rating, review_count = self._json_ld_rating_info(recipe_json_ld)
         
         # Fallback to HTML selectors if JSON-LD didn't work
         if rating == 0.0 and review_count == 0:
@@ -337,7 +619,7 @@ class FoodNetworkAdapter(BaseAdapter):
                 for elem in rating_elems:
                     rating_text = elem.get_text().strip()
                     # Look for decimal numbers (ratings)
-                    numbers = re.findall(r'\d+\.\d+', rating_text)
+                    numbers = DECIMAL_PATTERN.findall(rating_text)
                     if numbers:
                         rating = float(numbers[0])
                         break
@@ -358,7 +640,7 @@ class FoodNetworkAdapter(BaseAdapter):
                     review_text = elem.get_text().strip()
                     # Look for numbers in parentheses
                     if '(' in review_text and ')' in review_text:
-                        numbers = re.findall(r'\((\d+)\)', review_text)
+                        numbers = PAREN_INTEGER_PATTERN.findall(review_text)
                         if numbers:
                             review_count = int(numbers[0])
                             break
@@ -367,81 +649,32 @@ class FoodNetworkAdapter(BaseAdapter):
         
         return rating, review_count
     
-    def _extract_image_url(self, soup: BeautifulSoup) -> str:
+    def _extract_image_url(self, soup: BeautifulSoup, recipe_json_ld: Optional[Dict[str, Any]] = None) -> str:
         """Extract recipe image URL from JSON-LD structured data."""
-        # Look for JSON-LD structured data first (most reliable)
-        json_ld_scripts = soup.find_all('script', type='application/ld+json')
-        for script in json_ld_scripts:
-            try:
-                data = json.loads(script.string)
-                if isinstance(data, dict) and data.get('@type') == 'Recipe':
-                    # Check for image field
-                    if 'image' in data:
-                        image_data = data['image']
-                        if isinstance(image_data, str):
-                            return image_data
-                        elif isinstance(image_data, dict) and 'contentUrl' in image_data:
-                            return image_data['contentUrl']
-                    # Check for associatedMedia
-                    if 'associatedMedia' in data:
-                        media_data = data['associatedMedia']
-                        if isinstance(media_data, dict) and 'contentUrl' in media_data:
-                            return media_data['contentUrl']
-                    break
-            except (json.JSONDecodeError, TypeError):
-                continue
+        # Use JSON-LD structured data first (most reliable)
+        if recipe_json_ld:
+            image_url = self._json_ld_image_url(recipe_json_ld)
+            if image_url is not None:
+                return image_url
         
         # Fallback to HTML selectors if JSON-LD didn't work
-        image_selectors = [
-            '.recipe-image img',
-            '.hero-image img',
-            '.recipe-photo img',
-            'img[data-testid="recipe-image"]',
-        ]
-        
-        for selector in image_selectors:
-            img_elem = soup.select_one(selector)
-            if img_elem:
-                src = img_elem.get('src') or img_elem.get('data-src')
-                if src:
-                    return src
+        for img_elems in select_by_priority(soup, IMAGE_SELECTORS):
+            img_elem = img_elems[0]
+            src = img_elem.get('src') or img_elem.get('data-src')
+            if src:
+                return src
         
         return ""
     
-    def _extract_description(self, soup: BeautifulSoup) -> str:
+    def _extract_description(self, soup: BeautifulSoup, recipe_json_ld: Optional[Dict[str, Any]] = None) -> str:
         """Extract recipe description from JSON-LD structured data."""
-        # Look for JSON-LD structured data first (most reliable)
-        json_ld_scripts = soup.find_all('script', type='application/ld+json')
-        for script in json_ld_scripts:
-            try:
-                data = json.loads(script.string)
-                if isinstance(data, dict) and data.get('@type') == 'Recipe':
-                    # Check for description field
-                    if 'description' in data:
-                        return data['description']
-                    break
-            except (json.JSONDecodeError, TypeError):
-                continue
+        # Use JSON-LD structured data first (most reliable)
+        if recipe_json_ld and isinstance(recipe_json_ld.get('description'), str):
+            return html.unescape(recipe_json_ld['description'])
         
         # Fallback to HTML selectors if JSON-LD didn't work
-        description_selectors = [
-            # Food Network UK specific selectors (most likely to work)
-            '.p-summary',  # Microdata summary class
-            'p.summary',
-            '.recipe-info p',
-            '.recipe-details p',
-            '.summary p',
-            # Generic selectors
-            '.recipe-description',
-            '.recipe-summary',
-            '.description',
-            '[data-testid="description"]',
-        ]
-        
-        for selector in description_selectors:
-            desc_elem = soup.select_one(selector)
-            if desc_elem:
-                return desc_elem.get_text().strip()
+        for desc_elems in select_by_priority(soup, DESCRIPTION_SELECTORS):
+            return desc_elems[0].get_text().strip()
         
         return ""
     
@@ -455,7 +688,6 @@ class FoodNetworkAdapter(BaseAdapter):
         Returns:
             bool: True if this appears to be a jam recipe
         """
-        from scraper.core.recipe_validator import is_jam_recipe
         return is_jam_recipe(recipe_data)
     
     def extract_fruits_from_ingredients(self, ingredients: List[str]) -> List[str]:
@@ -468,11 +700,9 @@ class FoodNetworkAdapter(BaseAdapter):
         Returns:
             List[str]: List of fruit names found in the ingredients
         """
-        # Import the fruit mapping system
-        from scraper.fruit_mappings import extract_fruits_from_text
-        
-        # Combine all ingredients into a single text
-        ingredients_text = " ".join(ingredients)
+        # Combine the distinct ingredients into a single text; newlines stop a
+        # variation like "red currant" matching across two ingredients
+        ingredients_text = "\n".join(dict.fromkeys(ingredients))
         
         # Extract fruits using the shared fruit mapping system
         fruits = extract_fruits_from_text(ingredients_text)
@@ -5,11 +5,178 @@ This module implements the BaseAdapter interface for scraping recipes from Serio
 It handles Serious Eats-specific HTML parsing and data extraction.
 """
 
+import json
 import re
+from functools import lru_cache
 from typing import List, Dict, Any
 from urllib.parse import quote_plus
 
-from scraper.adapters.base_adapter import BaseAdapter
+import soupsieve
+from bs4 import BeautifulSoup
+
+from scraper.adapters.base_adapter import BaseAdapter, HTML_PARSER
+from scraper.core.recipe_validator import compile_keyword_pattern, has_jam_keyword, is_jam_recipe
+from scraper.core.selector_groups import compile_selector_group, select_by_priority
+
+# Serious Eats search URL format
+SEARCH_URL = "https://www.seriouseats.com/search?q={}"
+
+# Base for relative recipe links found in search results
+SITE_URL = "https://www.seriouseats.com"
+
+# Search result link selectors, most preferred first - Serious Eats specific
+SEARCH_LINK_SELECTORS = compile_selector_group([
+    'a[data-doc-id]',        # Serious Eats specific - recipe cards with data-doc-id
+    '.card[data-doc-id]',    # Alternative selector for recipe cards
+    '.card-list__item a',    # Card list item links
+    'a[href*="seriouseats.com"][href*="recipe"]',  # Recipe links
+    'a[href*="seriouseats.com"][href*="jam"]',     # Jam-specific links
+    'a[href*="/recipes/"]',  # Direct recipe links
+    'a[href*="/recipe/"]',   # Alternative recipe path
+    '.recipe-card a',        # Recipe card links
+    '.search-result a',      # Search result links
+    'article a',             # Article links
+    'h3 a, h4 a',            # Heading links
+    '.post-title a',         # Post title links
+    '.entry-title a',        # Entry title links
+])
+
+# Link titles containing these are site navigation, not recipes
+NAVIGATION_KEYWORDS = (
+    'recipes', 'dinner', 'easy', 'cuisines', 'cooking', 'dishes', 'ingredients', 'meal',
+    'techniques', 'add', 'login', 'see all', 'home', 'about', 'contact'
+)
+
+# Recipes that USE jam (should be filtered out)
+USES_JAM_KEYWORDS = (
+    'sandwich', 'sandwiches', 'cake', 'cupcake', 'muffin', 'bread', 'cookie', 'pie', 'tart',
+    'toast', 'pancake', 'waffle', 'crepe', 'danish', 'croissant', 'biscuit', 'scone',
+    'cheesecake', 'trifle', 'parfait', 'sundae', 'milkshake', 'smoothie', 'cocktail',
+    'sauce', 'glaze', 'frosting', 'icing', 'filling', 'topping', 'spread', 'dip',
+    'salad', 'dressing', 'marinade', 'rub', 'seasoning', 'garnish',
+    'with jam', 'using jam', 'jam filled', 'jam topped', 'jam glazed'
+)
+
+# Recipes that MAKE jam (should be included)
+MAKES_JAM_PATTERNS = (
+    'jam recipe', 'jam making', 'how to make', 'perfect jam', 'homemade jam',
+    'jam from', 'jam with', 'jam and', 'jam or', 'jam of', 'jam for',
+    'strawberry jam', 'cherry jam', 'blueberry jam', 'peach jam', 'apple jam',
+    'rhubarb jam', 'blackberry jam', 'raspberry jam', 'grape jam', 'orange jam',
+    'lemon jam', 'lime jam', 'apricot jam', 'plum jam', 'fig jam', 'pear jam'
+)
+
+# Fruits that make an otherwise ambiguous "... jam" title count as a jam recipe
+TITLE_FRUIT_KEYWORDS = (
+    'strawberry', 'cherry', 'blueberry', 'peach', 'apple', 'rhubarb', 'blackberry',
+    'raspberry', 'grape', 'orange', 'lemon', 'lime', 'apricot', 'plum', 'fig', 'pear',
+    'cranberry', 'elderberry', 'gooseberry', 'currant', 'mulberry', 'boysenberry'
+)
+
+# Each keyword list as one alternation, matched as substrings like the lists themselves
+NAVIGATION_PATTERN = compile_keyword_pattern(NAVIGATION_KEYWORDS)
+USES_JAM_PATTERN = compile_keyword_pattern(USES_JAM_KEYWORDS)
+MAKES_JAM_PATTERN = compile_keyword_pattern(MAKES_JAM_PATTERNS)
+TITLE_FRUIT_PATTERN = compile_keyword_pattern(TITLE_FRUIT_KEYWORDS)
+
+
+@lru_cache(maxsize=4096)
+def is_jam_making_title(title_lower: str) -> bool:
+    """
+    Check if a title represents a recipe FOR making jam (not a recipe that USES jam).
+    
+    Results are cached since the same recipes show up in searches for many fruits.
+    
+    Args:
+        title_lower (str): The recipe title to check, already lowercased
+        
+    Returns:
+        bool: True if this is a recipe for making jam, False otherwise
+    """
+    # Check if this is a recipe that USES jam
+    if USES_JAM_PATTERN.search(title_lower):
+        return False
+    
+    # Check if this is a recipe that MAKES jam
+    if MAKES_JAM_PATTERN.search(title_lower):
+        return True
+    
+    # If it just has "jam" but doesn't clearly make or use jam, be conservative
+    # Only include if it has fruit + jam pattern
+    has_fruit = TITLE_FRUIT_PATTERN.search(title_lower) is not None
+    has_jam = 'jam' in title_lower
+    
+    # Only include if it has both fruit and jam (likely a jam recipe)
+    return has_fruit and has_jam
+
+
+# Fruits reported by extract_fruits_from_ingredients
+INGREDIENT_FRUIT_KEYWORDS = (
+    "strawberry", "blueberry", "apple", "peach", "cherry", "grape",
+    "raspberry", "blackberry", "orange", "lemon", "lime", "banana"
+)
+INGREDIENT_FRUIT_PATTERN = compile_keyword_pattern(INGREDIENT_FRUIT_KEYWORDS)
+
+# Serving patterns, tried in order, with the unit each one reports
+SERVING_PATTERNS = (
+    (re.compile(r'(\d+)\s+servings?', re.IGNORECASE), "servings"),
+    (re.compile(r'yields?\s+(\d+)\s+servings?', re.IGNORECASE), "servings"),
+    (re.compile(r'makes?\s+(\d+)\s+servings?', re.IGNORECASE), "servings"),
+    (re.compile(r'(\d+)\s+\d*oz?\s+jars?', re.IGNORECASE), "jars"),
+    (re.compile(r'(\d+)\s+jars?', re.IGNORECASE), "jars"),
+)
+
+# Recipe yield block, searched before falling back to the whole page text
+YIELD_SELECTOR = soupsieve.compile('[itemprop="recipeYield"], [class*="yield"]')
+
+# Rating widgets used when the page has no JSON-LD rating - first match in the page wins
+RATING_SELECTOR = soupsieve.compile('.rating, .recipe-rating, .star-rating, .review-rating')
+REVIEW_COUNT_SELECTOR = soupsieve.compile('.review-count, .reviews, .rating-count, .comment-count')
+
+# Review counts shown next to the rating
+INTEGER_PATTERN = re.compile(r'\d+')
+
+# Serious Eats field selectors, most preferred first. The <meta> tags come first
+# and are looked up with find(), which stops at the first match in <head>.
+# Structured ingredients list - one combined selector, all items in page order
+INGREDIENT_SELECTOR = soupsieve.compile(
+    '.structured-ingredients__list-item, .recipe-ingredients li, .ingredients li, .ingredient-item, '
+    '.recipe-ingredient, .mntl-structured-ingredients__list-item, .ingredient, .recipe-ingredients-list li'
+)
+
+INSTRUCTION_SELECTORS = compile_selector_group([
+    '.mntl-sc-block-group--OL li',  # Serious Eats specific - ordered list for instructions
+    'ol li',                        # General ordered list items
+    '.recipe-instructions li',
+    '.instructions li',
+    '.recipe-steps li',
+    '.cooking-instructions p',
+    '.recipe-directions li',
+    '.directions li',
+])
+
+IMAGE_META_ATTRS = (
+    {'property': 'og:image'},
+    {'name': 'twitter:image'},
+)
+
+IMAGE_SELECTORS = compile_selector_group([
+    '.recipe-image img',
+    '.recipe-photo img',
+    '.main-image img',
+    '.featured-image img',
+    '.post-image img',
+])
+
+DESCRIPTION_META_ATTRS = {'name': 'description'}
+
+DESCRIPTION_SELECTORS = compile_selector_group([
+    '.recipe-description',
+    '.recipe-intro p',
+    '.recipe-summary',
+    '.post-excerpt p',
+    '.entry-summary p',
+])
 
 
 class SeriousEatsAdapter(BaseAdapter):
@@ -38,7 +205,7 @@ class SeriousEatsAdapter(BaseAdapter):
         # Serious Eats search URL format - search for fruit jam specifically
         search_query = f"{fruit_name} jam"
         encoded_query = quote_plus(search_query)
-        return f"https://www.seriouseats.com/search?q={encoded_query}"
+        return SEARCH_URL.format(encoded_query)
     
     def get_recipe_urls(self, search_results_html: str) -> List[str]:
         """
@@ -51,37 +218,12 @@ class SeriousEatsAdapter(BaseAdapter):
         Returns:
             List[str]: List of jam recipe URLs found on the search results page
         """
-        from bs4 import BeautifulSoup
-        import re
-        
-        soup = BeautifulSoup(search_results_html, 'html.parser')
-        
-        # Try multiple selectors for recipe links - Serious Eats specific
-        recipe_links = []
-        
-        # Try different possible selectors for Serious Eats recipe links
-        selectors_to_try = [
-            'a[data-doc-id]',        # Serious Eats specific - recipe cards with data-doc-id
-            '.card[data-doc-id]',    # Alternative selector for recipe cards
-            '.card-list__item a',    # Card list item links
-            'a[href*="seriouseats.com"][href*="recipe"]',  # Recipe links
-            'a[href*="seriouseats.com"][href*="jam"]',     # Jam-specific links
-            'a[href*="/recipes/"]',  # Direct recipe links
-            'a[href*="/recipe/"]',   # Alternative recipe path
-            '.recipe-card a',        # Recipe card links
-            '.search-result a',      # Search result links
-            'article a',             # Article links
-            'h3 a, h4 a',            # Heading links
-            '.post-title a',         # Post title links
-            '.entry-title a',        # Entry title links
-        ]
-        
-        for selector in selectors_to_try:
-            links = soup.select(selector)
-            if links:
-                recipe_links = links
-                print(f"✅ Found {len(recipe_links)} recipe links using selector: {selector}")
-                break
+        soup = BeautifulSoup(search_results_html, HTML_PARSER)
+        
+        # Try multiple selectors for recipe links in one traversal - Serious Eats specific
+        selector, recipe_links = next(select_by_priority(soup, SEARCH_LINK_SELECTORS, with_selectors=True), (None, []))
+        if recipe_links:
+            print(f"✅ Found {len(recipe_links)} recipe links using selector: {selector}")
         
         if not recipe_links:
             print("❌ No recipe links found with any selector")
@@ -91,6 +233,7 @@ class SeriousEatsAdapter(BaseAdapter):
             return []
         
         jam_recipe_urls = []
+        seen_urls = set()
         
         for link in recipe_links:
             # Extract the URL
@@ -99,12 +242,23 @@ class SeriousEatsAdapter(BaseAdapter):
                 continue
                 
             if not url.startswith('http'):
-                url = f"https://www.seriouseats.com{url}"
+                url = SITE_URL + url
             
-            # Extract the title from the link text or nearby elements
-            title = link.get_text(strip=True)
+            # Skip links to recipes we already collected before any title work
+            if url in seen_urls:
+                continue
+            
+            # Extract the title from the link text, then the link's own attributes
+            # (card links often carry it in aria-label/title)
+            title = (
+                link.get_text(strip=True) or
+                link.get('aria-label') or
+                link.get('title') or
+                link.get('alt') or
+                ''
+            )
             
-            # If title is empty, try to find it in nearby elements
+            # Only walk the tree when the link itself has no title
             if not title:
                 # Look for title in parent or sibling elements
                 parent = link.parent
@@ -112,26 +266,24 @@ class SeriousEatsAdapter(BaseAdapter):
                     title_elem = parent.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
                     if title_elem:
                         title = title_elem.get_text(strip=True)
-                    else:
-                        # Try alt text or other attributes
-                        title = link.get('alt', link.get('title', ''))
+            
+            title_lower = title.lower()
             
             # Filter out navigation links
-            navigation_keywords = ['recipes', 'dinner', 'easy', 'cuisines', 'cooking', 'dishes', 'ingredients', 'meal', 'techniques', 'add', 'login', 'see all', 'home', 'about', 'contact']
-            is_navigation = any(keyword in title.lower() for keyword in navigation_keywords)
+            is_navigation = NAVIGATION_PATTERN.search(title_lower) is not None
             
             # Check if this is a jam recipe (has "jam" in the title AND is actually making jam)
             # Filter out recipes that USE jam (like sandwiches, cakes) vs recipes that MAKE jam
             is_actual_jam_recipe = (
                 title and 
-                'jam' in title.lower() and 
-                url not in jam_recipe_urls and 
+                'jam' in title_lower and 
                 not is_navigation and
-                self._is_actual_jam_recipe_title(title)
+                self._is_actual_jam_recipe_title(title_lower)
             )
             
             if is_actual_jam_recipe:
                 jam_recipe_urls.append(url)
+                seen_urls.add(url)
                 print(f"Found jam recipe: {title[:50]}... -> {url}")
                 
                 # Stop when we have enough jam recipes (collect more to account for rejections)
@@ -140,58 +292,17 @@ class SeriousEatsAdapter(BaseAdapter):
         
         return jam_recipe_urls
     
-    def _is_actual_jam_recipe_title(self, title: str) -> bool:
+    def _is_actual_jam_recipe_title(self, title_lower: str) -> bool:
         """
         Check if a title represents a recipe FOR making jam (not a recipe that USES jam).
         
         Args:
-            title (str): The recipe title to check
+            title_lower (str): The recipe title to check, already lowercased
             
         Returns:
             bool: True if this is a recipe for making jam, False otherwise
         """
-        title_lower = title.lower()
-        
-        # Recipes that USE jam (should be filtered out)
-        uses_jam_keywords = [
-            'sandwich', 'sandwiches', 'cake', 'cupcake', 'muffin', 'bread', 'cookie', 'pie', 'tart',
-            'toast', 'pancake', 'waffle', 'crepe', 'danish', 'croissant', 'biscuit', 'scone',
-            'cheesecake', 'trifle', 'parfait', 'sundae', 'milkshake', 'smoothie', 'cocktail',
-            'sauce', 'glaze', 'frosting', 'icing', 'filling', 'topping', 'spread', 'dip',
-            'salad', 'dressing', 'marinade', 'rub', 'seasoning', 'garnish', 'garnish',
-            'with jam', 'using jam', 'jam filled', 'jam topped', 'jam glazed'
-        ]
-        
-        # Check if this is a recipe that USES jam
-        if any(keyword in title_lower for keyword in uses_jam_keywords):
-            return False
-        
-        # Recipes that MAKE jam (should be included)
-        makes_jam_patterns = [
-            'jam recipe', 'jam making', 'how to make', 'perfect jam', 'homemade jam',
-            'jam from', 'jam with', 'jam and', 'jam or', 'jam of', 'jam for',
-            'strawberry jam', 'cherry jam', 'blueberry jam', 'peach jam', 'apple jam',
-            'rhubarb jam', 'blackberry jam', 'raspberry jam', 'grape jam', 'orange jam',
-            'lemon jam', 'lime jam', 'apricot jam', 'plum jam', 'fig jam', 'pear jam'
-        ]
-        
-        # Check if this is a recipe that MAKES jam
-        if any(pattern in title_lower for pattern in makes_jam_patterns):
-            return True
-        
-        # If it just has "jam" but doesn't clearly make or use jam, be conservative
-        # Only include if it has fruit + jam pattern
-        fruit_keywords = [
-            'strawberry', 'cherry', 'blueberry', 'peach', 'apple', 'rhubarb', 'blackberry',
-            'raspberry', 'grape', 'orange', 'lemon', 'lime', 'apricot', 'plum', 'fig', 'pear',
-            'cranberry', 'elderberry', 'gooseberry', 'currant', 'mulberry', 'boysenberry'
-        ]
-        
-        has_fruit = any(fruit in title_lower for fruit in fruit_keywords)
-        has_jam = 'jam' in title_lower
-        
-        # Only include if it has both fruit and jam (likely a jam recipe)
-        return has_fruit and has_jam
+        return is_jam_making_title(title_lower)
     
     def extract_recipe_data(self, recipe_html: str, recipe_url: str) -> Dict[str, Any]:
         """
@@ -204,14 +315,19 @@ class SeriousEatsAdapter(BaseAdapter):
         Returns:
             Dict[str, Any]: Dictionary containing the extracted recipe data
         """
-        from bs4 import BeautifulSoup
-        import re
-        
-        soup = BeautifulSoup(recipe_html, 'html.parser')
+        soup = BeautifulSoup(recipe_html, HTML_PARSER)
         
         # Extract title
         title = self._extract_title(soup)
         
+        # Extract description
+        description = self._extract_description(soup)
+        
+        # Reject non-jam pages before the ingredient, rating (JSON-LD) and servings passes
+        if not has_jam_keyword(title, description):
+            print(f"⚠️  Recipe '{title}' failed jam validation: no jam keyword in title or description")
+            raise ValueError(f"Recipe '{title}' is not a jam recipe")
+        
         # Extract ingredients
         ingredients = self._extract_ingredients(soup)
         
@@ -229,9 +345,6 @@ class SeriousEatsAdapter(BaseAdapter):
         
         # Extract time information
         
-        # Extract description
-        description = self._extract_description(soup)
-        
         recipe_data = {
             "title": title,
             "ingredients": ingredients,
@@ -267,24 +380,22 @@ class SeriousEatsAdapter(BaseAdapter):
     
     def _extract_title(self, soup) -> str:
         """Extract recipe title from HTML."""
-        # Try multiple selectors for title - Serious Eats specific
-        title_selectors = [
-            'h1.recipe-title',
-            'h1[class*="title"]',
-            'h1.entry-title',
-            'h1.post-title',
-            'h1',
-            'title'
-        ]
-        
-        for selector in title_selectors:
-            title_elem = soup.select_one(selector)
-            if title_elem:
-                title = title_elem.get_text(strip=True)
-                # Clean up title (remove "Recipe" suffix if present)
-                if title.endswith(' Recipe'):
-                    title = title[:-7]
-                return title
+        # Same priority as the selectors 'h1.recipe-title', 'h1[class*="title"]',
+        # 'h1', 'title' - but pages have only a handful of <h1>s to rank
+        h1_elems = soup.find_all('h1')
+        if h1_elems:
+            title_elem = next((h1 for h1 in h1_elems if 'recipe-title' in h1.get('class', [])), None)
+            if title_elem is None:
+                title_elem = next((h1 for h1 in h1_elems if 'title' in ' '.join(h1.get('class', []))), h1_elems[0])
+        else:
+            title_elem = soup.title
+        
+        if title_elem is not None:
+            title = title_elem.get_text(strip=True)
+            # Clean up title (remove "Recipe" suffix if present)
+            if title.endswith(' Recipe'):
+                title = title[:-7]
+            return title
         
         return "Untitled Recipe"
     
@@ -293,7 +404,7 @@ class SeriousEatsAdapter(BaseAdapter):
         ingredients = []
         
         # Look for structured ingredients list - Serious Eats specific selectors
-        ingredient_items = soup.select('.structured-ingredients__list-item, .recipe-ingredients li, .ingredients li, .ingredient-item, .recipe-ingredient, .mntl-structured-ingredients__list-item, .ingredient, .recipe-ingredients-list li')
+        ingredient_items = INGREDIENT_SELECTOR.select(soup)
         
         for item in ingredient_items:
             try:
@@ -325,20 +436,8 @@ class SeriousEatsAdapter(BaseAdapter):
         instructions = []
         
         # Look for instruction steps in the recipe content - Serious Eats specific
-        instruction_selectors = [
-            '.mntl-sc-block-group--OL li',  # Serious Eats specific - ordered list for instructions
-            'ol li',                        # General ordered list items
-            '.recipe-instructions li',
-            '.instructions li',
-            '.recipe-steps li',
-            '.cooking-instructions p',
-            '.recipe-directions li',
-            '.directions li'
-        ]
-        
-        for selector in instruction_selectors:
-            instruction_elements = soup.select(selector)
-            for elem in instruction_elements:
+        for instruction_elems in select_by_priority(soup, INSTRUCTION_SELECTORS):
+            for elem in instruction_elems:
                 text = elem.get_text(strip=True)
                 if text and len(text) > 10:  # Filter out very short text
                     instructions.append(text)
@@ -356,9 +455,14 @@ class SeriousEatsAdapter(BaseAdapter):
         # Look for JSON-LD structured data first (Serious Eats uses this)
         json_ld_scripts = soup.find_all('script', type='application/ld+json')
         for script in json_ld_scripts:
+            # Only parse blocks that can carry a rating (skips BreadcrumbList, WebPage, ...).
+            # Every rating block is still read, so the last one on the page wins.
+            raw = script.string or ''
+            if '"aggregateRating"' not in raw and '"review"' not in raw:
+                continue
+            
             try:
-                import json
-                data = json.loads(script.string)
+                data = json.loads(raw)
                 
                 # Handle both single objects and arrays
                 if isinstance(data, list):
@@ -375,7 +479,7 @@ class SeriousEatsAdapter(BaseAdapter):
         # Fallback to traditional selectors if JSON-LD didn't work
         if rating == 0.0 and review_count == 0:
             # Look for rating elements - Serious Eats specific
-            rating_elem = soup.select_one('.rating, .recipe-rating, .star-rating, .review-rating')
+            rating_elem = RATING_SELECTOR.select_one(soup)
             if rating_elem:
                 try:
                     rating = float(rating_elem.get_text(strip=True))
@@ -383,11 +487,11 @@ class SeriousEatsAdapter(BaseAdapter):
                     pass
             
             # Look for review count
-            review_elem = soup.select_one('.review-count, .reviews, .rating-count, .comment-count')
+            review_elem = REVIEW_COUNT_SELECTOR.select_one(soup)
             if review_elem:
                 review_text = review_elem.get_text(strip=True)
                 # Extract number from text
-                numbers = re.findall(r'\d+', review_text)
+                numbers = INTEGER_PATTERN.findall(review_text)
                 if numbers:
                     try:
                         review_count = int(numbers[0])
@@ -447,54 +551,40 @@ class SeriousEatsAdapter(BaseAdapter):
     def _extract_image_url(self, soup) -> str:
         """Extract primary recipe image URL from HTML."""
         # Try multiple selectors for recipe image - Serious Eats specific
-        image_selectors = [
-            'meta[property="og:image"]',
-            'meta[name="twitter:image"]',
-            '.recipe-image img',
-            '.recipe-photo img',
-            '.main-image img',
-            '.featured-image img',
-            '.post-image img'
-        ]
-        
-        for selector in image_selectors:
-            img_elem = soup.select_one(selector)
-            if img_elem:
-                if img_elem.name == 'meta':
-                    image_url = img_elem.get('content', '')
-                else:
-                    image_url = img_elem.get('src', '')
-                
+        for meta_attrs in IMAGE_META_ATTRS:
+            meta_elem = soup.find('meta', attrs=meta_attrs)
+            if meta_elem:
+                image_url = meta_elem.get('content', '')
                 if image_url and image_url.startswith('http'):
                     return image_url
         
+        for img_elems in select_by_priority(soup, IMAGE_SELECTORS):
+            image_url = img_elems[0].get('src', '')
+            if image_url and image_url.startswith('http'):
+                return image_url
+        
         return ""
     
     def _extract_servings(self, soup) -> str:
         """Extract servings/yield information from HTML."""
-        import re
-        
-        # Get all text from the page
-        all_text = soup.get_text()
-        
+        # Look in the recipe's yield block first - avoids serialising the whole page
+        yield_elem = YIELD_SELECTOR.select_one(soup)
+        if yield_elem:
+            servings = self._match_servings(yield_elem.get_text(' '))
+            if servings:
+                return servings
+        
+        # Fall back to all text on the page
+        return self._match_servings(soup.get_text(' '))
+    
+    def _match_servings(self, text: str) -> str:
+        """Return the first serving/jar count found in text, or an empty string."""
         # Look for serving patterns - Serious Eats specific
-        serving_patterns = [
-            r'(\d+)\s+servings?',
-            r'yields?\s+(\d+)\s+servings?',
-            r'makes?\s+(\d+)\s+servings?',
-            r'(\d+)\s+\d*oz?\s+jars?',
-            r'(\d+)\s+jars?'
-        ]
-        
-        for pattern in serving_patterns:
-            matches = re.findall(pattern, all_text, re.IGNORECASE)
-            if matches:
+        for pattern, unit in SERVING_PATTERNS:
+            match = pattern.search(text)
+            if match:
                 # Return the first match with "servings" or "jars"
-                serving_count = matches[0]
-                if 'jar' in pattern.lower():
-                    return f"{serving_count} jars"
-                else:
-                    return f"{serving_count} servings"
+                return f"{match.group(1)} {unit}"
         
         return ""
     
@@ -502,25 +592,16 @@ class SeriousEatsAdapter(BaseAdapter):
     def _extract_description(self, soup) -> str:
         """Extract recipe description from HTML."""
         # Look for description in meta tags or intro content - Serious Eats specific
-        desc_selectors = [
-            'meta[name="description"]',
-            '.recipe-description',
-            '.recipe-intro p',
-            '.recipe-summary',
-            '.post-excerpt p',
-            '.entry-summary p'
-        ]
-        
-        for selector in desc_selectors:
-            desc_elem = soup.select_one(selector)
-            if desc_elem:
-                if desc_elem.name == 'meta':
-                    description = desc_elem.get('content', '')
-                else:
-                    description = desc_elem.get_text(strip=True)
-                
-                if description and len(description) > 20:
-                    return description
+        meta_elem = soup.find('meta', attrs=DESCRIPTION_META_ATTRS)
+        if meta_elem:
+            description = meta_elem.get('content', '')
+            if description and len(description) > 20:
+                return description
+        
+        for desc_elems in select_by_priority(soup, DESCRIPTION_SELECTORS):
+            description = desc_elems[0].get_text(strip=True)
+            if description and len(description) > 20:
+                return description
         
         return ""
     
@@ -536,17 +617,19 @@ class SeriousEatsAdapter(BaseAdapter):
         """
         # Simple fruit detection - look for common fruit names
         fruits = []
-        fruit_keywords = [
-            "strawberry", "blueberry", "apple", "peach", "cherry", "grape",
-            "raspberry", "blackberry", "orange", "lemon", "lime", "banana"
-        ]
+        found_fruits = set()
         
         for ingredient in ingredients:
             ingredient_name = ingredient.get("name", "").lower()
-            for fruit in fruit_keywords:
+            # Most ingredients (sugar, pectin, ...) mention no fruit at all
+            if not INGREDIENT_FRUIT_PATTERN.search(ingredient_name):
+                continue
+            
+            for fruit in INGREDIENT_FRUIT_KEYWORDS:
                 if fruit in ingredient_name:
                     # Check if this fruit is already in our list
-                    if not any(f["fruit_name"] == fruit for f in fruits):
+                    if fruit not in found_fruits:
+                        found_fruits.add(fruit)
                         # Determine if it's primary (strawberry for strawberry jam)
                         is_primary = fruit == "strawberry"  # For now, assume strawberry is primary
                         fruits.append({"fruit_name": fruit, "is_primary": is_primary})
@@ -563,5 +646,4 @@ class SeriousEatsAdapter(BaseAdapter):
         Returns:
             bool: True if this is a jam recipe, False otherwise
         """
-        from scraper.core.recipe_validator import is_jam_recipe
         return is_jam_recipe(recipe_data)
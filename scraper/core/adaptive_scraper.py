@@ -6,13 +6,16 @@ requests-based scraping (fast) and Selenium-based scraping (for JavaScript sites
 based on the adapter's requirements.
 """
 
+import logging
 import time
 from typing import List, Dict, Any
 
-from scraper.core.base_scraper import BaseScraper
+from scraper.core.base_scraper import BaseScraper, DEFAULT_MAX_WORKERS
 from scraper.core.selenium_scraper import SeleniumScraper
 from scraper.adapters.base_adapter import BaseAdapter
 
+logger = logging.getLogger(__name__)
+
 
 class AdaptiveScraper:
     """
@@ -23,21 +26,27 @@ class AdaptiveScraper:
     sites (fast) and JavaScript-rendered sites (Selenium) transparently.
     """
     
-    def __init__(self, rate_limit: float = 0.3, headless: bool = True):
+    def __init__(self, rate_limit: float = 0.3, headless: bool = True, max_workers: int = DEFAULT_MAX_WORKERS):
         """
         Initialize the adaptive scraper.
         
         Args:
             rate_limit (float): Time to wait between requests in seconds
             headless (bool): Whether to run Selenium in headless mode
+            max_workers (int): Recipe pages fetched concurrently by the requests method
         """
         self.rate_limit = rate_limit
         self.headless = headless
-        self.requests_scraper = BaseScraper(rate_limit)
+        self.requests_scraper = BaseScraper(rate_limit, max_workers=max_workers)
         self.selenium_scraper = None  # Initialize lazily
     
     def _get_selenium_scraper(self) -> SeleniumScraper:
-        """Get or create the Selenium scraper (lazy initialization)."""
+        """
+        Get or create the Selenium scraper (lazy initialization).
+        
+        The browser pool is started once and reused for every site and fruit scraped
+        with this instance, until close() is called.
+        """
         if self.selenium_scraper is None:
             self.selenium_scraper = SeleniumScraper(
                 rate_limit=self.rate_limit,
@@ -59,7 +68,7 @@ class AdaptiveScraper:
         method = adapter.get_scraping_method()
         site_name = adapter.get_site_name()
         
-        print(f"Scraping {site_name} for {fruit_name} recipes using {method} method...")
+        logger.info("Scraping %s for %s recipes using %s method...", site_name, fruit_name, method)
         
         try:
             if method == "requests":
@@ -70,24 +79,25 @@ class AdaptiveScraper:
                 raise ValueError(f"Unknown scraping method: {method}")
                 
         except Exception as e:
-            print(f"Error scraping {site_name} with {method}: {e}")
+            logger.error("Error scraping %s with %s: %s", site_name, method, e)
             return []
     
     def _scrape_with_requests(self, adapter: BaseAdapter, fruit_name: str) -> List[Dict[str, Any]]:
-        """Scrape using the fast requests-based method."""
-        print(f"Using fast requests method for {adapter.get_site_name()}")
+        """Scrape using the fast requests-based method (recipe pages fetched concurrently)."""
+        logger.debug("Using fast requests method for %s", adapter.get_site_name())
         return self.requests_scraper.scrape_site(adapter, fruit_name)
     
     def _scrape_with_selenium(self, adapter: BaseAdapter, fruit_name: str) -> List[Dict[str, Any]]:
         """Scrape using Selenium for JavaScript-rendered content."""
-        print(f"Using Selenium method for {adapter.get_site_name()}")
+        logger.debug("Using Selenium method for %s", adapter.get_site_name())
         selenium_scraper = self._get_selenium_scraper()
         return selenium_scraper.scrape_site_with_selenium(adapter, fruit_name)
     
     def close(self):
-        """Close any open resources (Selenium WebDriver)."""
+        """Close any open resources (Selenium WebDriver). Safe to call more than once."""
         if self.selenium_scraper:
             self.selenium_scraper.close()
+            self.selenium_scraper = None
     
     def __enter__(self):
         """Context manager entry."""
@@ -5,13 +5,80 @@ This module contains the core scraper that orchestrates the scraping process.
 It uses site-specific adapters to scrape recipes from different websites.
 """
 
+import gzip
+import logging
+import os
+import re
 import requests
+import threading
 import time
-from typing import List, Dict, Any
-from urllib.parse import urljoin
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
+from urllib.parse import urljoin, urlparse, urlsplit
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from scraper.adapters.base_adapter import BaseAdapter
 
+logger = logging.getLogger(__name__)
+
+# Ask for brotli-compressed pages when urllib3 can decode them (smaller than gzip)
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+# Persist fetched pages on disk between runs when requests-cache is installed
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# On-disk page cache shared by the requests and Selenium scrapers; recipe pages
+# rarely change within a day, so re-runs for the same fruit skip the network.
+# Kept at the repository root (git-ignored) whatever the working directory.
+PAGE_CACHE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '.cache'))
+PAGE_CACHE_EXPIRY_SECONDS = 24 * 60 * 60
+
+# charset parameter of a Content-Type header
+CHARSET_PATTERN = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+
+# <meta charset="..."> or <meta http-equiv="Content-Type" content="...; charset=...">,
+# looked for in the first META_CHARSET_SCAN_BYTES of a page (HTML5 requires it
+# within the first 1024 bytes; older pages put it a little later)
+META_CHARSET_PATTERN = re.compile(rb'<meta\s[^>]*?charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+META_CHARSET_SCAN_BYTES = 4096
+
+# Recipe pages fetched at once per site; fetches are network-bound, so
+# overlapping their latency matters far more than parsing speed
+DEFAULT_MAX_WORKERS = 8
+
+# Sites scraped at once by scrape_multiple_sites (each has its own recipe workers)
+MAX_PARALLEL_SITES = 8
+
+# Pages kept in memory per scraper, so URLs seen again (the same recipe found
+# for several fruits, retries) are not fetched twice
+HTML_CACHE_SIZE = 256
+
+# Cached pages are stored gzip-compressed (HTML shrinks ~5-10x); level 1 keeps
+# compressing cheap next to a network fetch
+HTML_CACHE_COMPRESS_LEVEL = 1
+
+# Requests a host may receive back-to-back before rate_limit spacing kicks in
+RATE_LIMIT_BURST = 3
+
+# Responses that mean "slow down and try again", with how often to retry them
+RETRY_STATUS_CODES = (429, 503)
+MAX_FETCH_ATTEMPTS = 4
+RETRY_BACKOFF_SECONDS = 1.0
+MAX_RETRY_DELAY_SECONDS = 60.0
+
+# Hosts whose keep-alive connection pools the session holds on to
+CONNECTION_POOL_HOSTS = 32
+
 
 class BaseScraper:
     """
@@ -21,18 +88,48 @@ class BaseScraper:
     and data processing, while delegating site-specific logic to adapters.
     """
     
-    def __init__(self, rate_limit: float = 0.3):
+    def __init__(self, rate_limit: float = 0.3, max_workers: int = DEFAULT_MAX_WORKERS):
         """
         Initialize the base scraper.
         
         Args:
-            rate_limit (float): Time to wait between requests in seconds
+            rate_limit (float): Time to wait between requests to the same host in seconds
+            max_workers (int): Number of recipe pages to fetch concurrently
         """
         self.rate_limit = rate_limit
-        self.session = requests.Session()
+        self.max_workers = max_workers
+        # Per-host token bucket, stored as the time each host's bucket is next
+        # empty (GCRA form), shared by all workers
+        self._next_request_time = {}
+        self._rate_limit_lock = threading.Lock()
+        # LRU cache of fetched page HTML keyed by URL
+        self._html_cache = OrderedDict()
+        self._html_cache_lock = threading.Lock()
+        if requests_cache is not None:
+            self.session = requests_cache.CachedSession(
+                cache_name=os.path.join(PAGE_CACHE_DIR, 'scraper'),
+                backend='sqlite',
+                expire_after=PAGE_CACHE_EXPIRY_SECONDS,
+                allowable_methods=('GET',)
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept-Encoding': ACCEPT_ENCODING
         })
+        
+        # Keep a warm connection for every worker that can be talking to a host at
+        # once (the default pool of 10 would be reopening connections). Dropped
+        # connections and 500/502/504s are retried here; 429/503 are retried in
+        # fetch_html so the whole host backs off.
+        http_adapter = HTTPAdapter(
+            pool_connections=CONNECTION_POOL_HOSTS,
+            pool_maxsize=max(max_workers, 10),
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 504), raise_on_status=False)
+        )
+        self.session.mount("https://", http_adapter)
+        self.session.mount("http://", http_adapter)
     
     def scrape_site(self, adapter: BaseAdapter, fruit_name: str) -> List[Dict[str, Any]]:
         """
@@ -45,53 +142,253 @@ class BaseScraper:
         Returns:
             List[Dict[str, Any]]: List of scraped recipe data
         """
-        print(f"Scraping {adapter.get_site_name()} for {fruit_name} recipes...")
+        logger.info("Scraping %s for %s recipes...", adapter.get_site_name(), fruit_name)
         
         # Step 1: Get search URL from adapter
         search_url = adapter.search_for_fruit(fruit_name)
-        print(f"Search URL: {search_url}")
+        logger.debug("Search URL: %s", search_url)
         
         # Step 2: Make search request
         try:
-            response = self.session.get(search_url)
-            response.raise_for_status()
-            search_results_html = response.text
-            print(f"Search request successful, got {len(search_results_html)} characters")
+            search_results_html = self.fetch_html(search_url)
+            logger.debug("Search request successful, got %d characters", len(search_results_html))
         except requests.RequestException as e:
-            print(f"Error making search request: {e}")
+            logger.error("Error making search request: %s", e)
             return []
         
         # Step 3: Get recipe URLs from adapter
-        recipe_urls = adapter.get_recipe_urls(search_results_html)
-        print(f"Found {len(recipe_urls)} recipe URLs")
+        recipe_urls = self._unique_urls(adapter.get_recipe_urls(search_results_html))
+        logger.info("Found %d recipe URLs", len(recipe_urls))
+        
+        # Step 4: Scrape recipes concurrently (results keep the search order)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self._scrape_recipe, adapter, recipe_url, i, len(recipe_urls))
+                for i, recipe_url in enumerate(recipe_urls)
+            ]
+            results = [future.result() for future in futures]
+        recipes = [recipe_data for recipe_data in results if recipe_data is not None]
+        
+        logger.info("Scraping complete. Got %d recipes from %s", len(recipes), adapter.get_site_name())
+        return recipes
+    
+    def _unique_urls(self, urls: List[str]) -> List[str]:
+        """
+        Drop URLs that point at a page already in the list, keeping the first.
+        
+        URLs differing only in host case, a trailing slash or a #fragment are
+        the same page, so only the first of them is fetched.
+        
+        Args:
+            urls (List[str]): Recipe URLs in search result order
+            
+        Returns:
+            List[str]: The URLs with duplicates removed, in the same order
+        """
+        unique_urls = {}
+        for url in urls:
+            parts = urlsplit(url)
+            key = (parts.scheme, parts.netloc.lower(), parts.path.rstrip('/'), parts.query)
+            unique_urls.setdefault(key, url)
+        return list(unique_urls.values())
+    
+    def _scrape_recipe(self, adapter: BaseAdapter, recipe_url: str, index: int, total: int) -> Optional[Dict[str, Any]]:
+        """
+        Fetch and extract a single recipe page (runs on a worker thread).
+        
+        Args:
+            adapter (BaseAdapter): The site-specific adapter to use
+            recipe_url (str): The URL of the recipe page
+            index (int): Position of the recipe in the search results
+            total (int): Number of recipe URLs being scraped
+            
+        Returns:
+            Optional[Dict[str, Any]]: The extracted recipe data, or None if it failed
+        """
+        logger.debug("Scraping recipe %d/%d: %s", index + 1, total, recipe_url)
+        
+        try:
+            # Make request for recipe page
+            recipe_html = self.fetch_html(recipe_url)
+            
+            # Extract recipe data using adapter
+            recipe_data = adapter.extract_recipe_data(recipe_html, recipe_url)
+            logger.debug("Successfully scraped recipe: %s", recipe_data.get('title', 'Unknown'))
+            return recipe_data
+            
+        except Exception as e:
+            logger.warning("Error scraping recipe %s: %s", recipe_url, e)
+            return None
+    
+    def fetch_html(self, url: str) -> str:
+        """
+        Get the HTML of a page, from the cache if it was fetched before.
+        
+        Args:
+            url (str): The URL to fetch
+            
+        Returns:
+            str: The HTML content of the page
+            
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        html = self._get_cached_html(url)
+        if html is not None:
+            return html
+        
+        # Answers from the on-disk cache never reach the site, so they don't
+        # wait for (or use up) the host's rate-limit tokens
+        from_page_cache = self._is_page_cached(url)
         
-        # Step 4: Scrape each recipe
-        recipes = []
-        for i, recipe_url in enumerate(recipe_urls):
-            print(f"Scraping recipe {i+1}/{len(recipe_urls)}: {recipe_url}")
+        for attempt in range(MAX_FETCH_ATTEMPTS):
+            if not from_page_cache or attempt > 0:
+                self._wait_for_rate_limit(url)
+            response = self.session.get(url)
+            if response.status_code not in RETRY_STATUS_CODES or attempt == MAX_FETCH_ATTEMPTS - 1:
+                break
             
+            # Back off on this host for every worker, not just this request
+            delay = self._retry_delay(response, attempt)
+            logger.warning("⚠️  %d from %s, retrying in %.1fs", response.status_code, url, delay)
+            self._pause_host(url, delay)
+        
+        response.raise_for_status()
+        html = self._decode_html(response)
+        
+        self._cache_html(url, html)
+        return html
+    
+    def _is_page_cached(self, url: str) -> bool:
+        """
+        Check whether requests-cache holds a fresh copy of a page.
+        
+        Args:
+            url (str): The URL about to be requested
+            
+        Returns:
+            bool: True if the session will answer from disk without a request
+        """
+        cache = getattr(self.session, 'cache', None)
+        if cache is None:
+            return False
+        
+        cached_response = cache.get_response(cache.create_key(requests.Request('GET', url)))
+        return cached_response is not None and not cached_response.is_expired
+    
+    def _decode_html(self, response: requests.Response) -> str:
+        """
+        Decode a page body once, using the charset the page declares.
+        
+        The charset comes from the Content-Type header, else from a <meta>
+        tag near the top of the page. Undeclared pages are decoded as UTF-8
+        when they are valid UTF-8, and otherwise with the encoding requests
+        detects from the bytes (response.apparent_encoding).
+        
+        Args:
+            response (requests.Response): A successful page response
+            
+        Returns:
+            str: The decoded HTML
+        """
+        content = response.content
+        charset = CHARSET_PATTERN.search(response.headers.get('Content-Type', ''))
+        if charset:
+            encoding = charset.group(1)
+        else:
+            meta_charset = META_CHARSET_PATTERN.search(content[:META_CHARSET_SCAN_BYTES])
+            encoding = meta_charset.group(1).decode('ascii') if meta_charset else None
+        
+        if encoding is not None:
             try:
-                # Make request for recipe page
-                response = self.session.get(recipe_url)
-                response.raise_for_status()
-                recipe_html = response.text
-                
-                # Extract recipe data using adapter
-                recipe_data = adapter.extract_recipe_data(recipe_html, recipe_url)
-                recipes.append(recipe_data)
-                
-                print(f"Successfully scraped recipe: {recipe_data.get('title', 'Unknown')}")
-                
-                # Rate limiting
-                if i < len(recipe_urls) - 1:  # Don't wait after the last request
-                    time.sleep(self.rate_limit)
-                    
-            except Exception as e:
-                print(f"Error scraping recipe {recipe_url}: {e}")
-                continue
-        
-        print(f"Scraping complete. Got {len(recipes)} recipes from {adapter.get_site_name()}")
-        return recipes
+                return content.decode(encoding, errors='replace')
+            except LookupError:
+                # Unknown charset name, fall through to detection
+                pass
+        
+        try:
+            return content.decode('utf-8')
+        except UnicodeDecodeError:
+            # Only undeclared, non-UTF-8 pages pay for detection over the body
+            encoding = response.apparent_encoding or 'utf-8'
+            try:
+                return content.decode(encoding, errors='replace')
+            except LookupError:
+                return content.decode('utf-8', errors='replace')
+    
+    def _get_cached_html(self, url: str) -> Optional[str]:
+        """Return cached HTML for a URL (marking it recently used), or None."""
+        with self._html_cache_lock:
+            compressed_html = self._html_cache.get(url)
+            if compressed_html is None:
+                return None
+            self._html_cache.move_to_end(url)
+        return gzip.decompress(compressed_html).decode('utf-8')
+    
+    def _cache_html(self, url: str, html: str):
+        """Store fetched HTML, evicting the least recently used page when full."""
+        compressed_html = gzip.compress(html.encode('utf-8'), compresslevel=HTML_CACHE_COMPRESS_LEVEL)
+        with self._html_cache_lock:
+            self._html_cache[url] = compressed_html
+            self._html_cache.move_to_end(url)
+            if len(self._html_cache) > HTML_CACHE_SIZE:
+                self._html_cache.popitem(last=False)
+    
+    def _wait_for_rate_limit(self, url: str):
+        """
+        Block until a request to the URL's host is allowed.
+        
+        Each host gets a token bucket holding RATE_LIMIT_BURST requests and
+        refilling one request every rate_limit seconds, shared by all worker
+        threads. A burst goes out at once; after that requests are spaced
+        rate_limit apart while their responses are still awaited concurrently.
+        
+        Args:
+            url (str): The URL about to be requested
+        """
+        host = urlparse(url).netloc
+        with self._rate_limit_lock:
+            now = time.monotonic()
+            empty_time = max(now, self._next_request_time.get(host, now))
+            start_time = max(now, empty_time - self.rate_limit * (RATE_LIMIT_BURST - 1))
+            self._next_request_time[host] = empty_time + self.rate_limit
+        
+        delay = start_time - now
+        if delay > 0:
+            time.sleep(delay)
+    
+    def _pause_host(self, url: str, delay: float):
+        """
+        Hold back all requests to the URL's host for at least delay seconds.
+        
+        Args:
+            url (str): A URL on the host that asked us to slow down
+            delay (float): Seconds before the next request may start
+        """
+        host = urlparse(url).netloc
+        with self._rate_limit_lock:
+            # Empty the bucket far enough ahead that the next start is delay away
+            paused_until = time.monotonic() + delay + self.rate_limit * (RATE_LIMIT_BURST - 1)
+            self._next_request_time[host] = max(self._next_request_time.get(host, 0.0), paused_until)
+    
+    def _retry_delay(self, response: requests.Response, attempt: int) -> float:
+        """
+        Work out how long to wait before retrying a throttled request.
+        
+        Args:
+            response (requests.Response): The 429/503 response
+            attempt (int): Zero-based number of the attempt that failed
+            
+        Returns:
+            float: Seconds to wait, from Retry-After when the server sent one,
+            otherwise exponential backoff
+        """
+        retry_after = response.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            delay = float(retry_after)
+        else:
+            delay = RETRY_BACKOFF_SECONDS * (2 ** attempt)
+        return min(delay, MAX_RETRY_DELAY_SECONDS)
     
     def scrape_multiple_sites(self, adapters: List[BaseAdapter], fruit_name: str) -> List[Dict[str, Any]]:
         """
@@ -105,14 +402,23 @@ class BaseScraper:
             List[Dict[str, Any]]: List of all scraped recipe data
         """
         all_recipes = []
+        if not adapters:
+            logger.info("Total recipes scraped: %d", len(all_recipes))
+            return all_recipes
         
-        for adapter in adapters:
-            try:
-                recipes = self.scrape_site(adapter, fruit_name)
-                all_recipes.extend(recipes)
-            except Exception as e:
-                print(f"Error scraping {adapter.get_site_name()}: {e}")
-                continue
+        # Sites are independent and network-bound, so scrape them at the same time;
+        # the per-host rate limit still applies to each site
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_SITES, len(adapters))) as executor:
+            futures = [(adapter, executor.submit(self.scrape_site, adapter, fruit_name)) for adapter in adapters]
+            
+            # Collect in adapter order so results don't depend on which site finished first
+            for adapter, future in futures:
+                try:
+                    recipes = future.result()
+                    all_recipes.extend(recipes)
+                except Exception as e:
+                    logger.error("Error scraping %s: %s", adapter.get_site_name(), e)
+                    continue
         
-        print(f"Total recipes scraped: {len(all_recipes)}")
+        logger.info("Total recipes scraped: %d", len(all_recipes))
         return all_recipes
@@ -0,0 +1,49 @@
+"""
+Logging Setup
+
+The core scrapers log through the logging module instead of print. Worker
+threads only put records on a queue; a single listener thread formats them
+and writes to stderr, so fetch threads never block on terminal output. The
+scripts' own progress prints stay on stdout.
+"""
+
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_FORMAT = "[%(asctime)s] %(message)s"
+LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_listener = None
+
+
+def configure_logging(verbose: bool = False):
+    """
+    Send log records from every thread to stderr through a queue.
+
+    Safe to call more than once; only the first call installs the handlers.
+
+    Args:
+        verbose (bool): Also show the scraper's per-page DEBUG messages
+            (third-party libraries such as urllib3 and selenium stay at INFO)
+    """
+    global _listener
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    logging.getLogger('scraper').setLevel(logging.DEBUG if verbose else logging.INFO)
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT))
+
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, stream_handler)
+    _listener.start()
+
+    # Flush whatever is still queued when the script exits
+    atexit.register(_listener.stop)
@@ -5,9 +5,89 @@ This module provides consistent validation logic across all adapters
 to determine if a recipe is actually a jam recipe.
 """
 
+import re
 from typing import List, Dict, Any
 
 
+# Keywords that mark a title/description as being about jam
+JAM_KEYWORDS = ("jam", "jelly", "preserve", "marmalade", "conserve")
+
+# Ingredients used when making jam
+JAM_INGREDIENTS = ("sugar", "pectin", "lemon juice", "lime juice", "citric acid")
+
+# Ingredients containing "jam" that are still legitimate jam-making ingredients
+JAM_MAKING_INGREDIENTS = ("jam sugar", "preserving sugar", "jam setting sugar")
+
+# Title keywords for recipes that are not jam (or that use jam rather than make it)
+NON_JAM_KEYWORDS = (
+    "cake", "cupcake", "muffin", "bread", "cookie", "pie", "tart",
+    "sandwich", "toast", "pancake", "waffle", "crepe", "danish",
+    "cheesecake", "trifle", "parfait", "sundae", "milkshake",
+    "smoothie", "cocktail", "sauce", "glaze", "frosting", "icing",
+    "filling", "topping", "spread", "dip", "salad", "dressing",
+    "marinade", "rub", "seasoning", "garnish", "popsicle", "frozen",
+    "ice cream", "sorbet", "granita", "sherbet", "bar", "bars",
+    "doughnut", "doughnuts", "donut", "donuts", "crostata", "tarts",
+    "pastry", "pastries", "scuffin", "roll", "egg roll", "fried",
+    "baked", "oven", "flour", "baking powder", "baking soda", "yeast",
+    "dough", "drink", "beverage", "mocktail", "juice",
+    # Additional non-jam indicators
+    "sponge", "scones", "scone", "baguette", "turnovers", "turnover",
+    "board", "grazing", "chicken", "thighs", "rice", "peas", "beef",
+    "pork", "fish", "salmon", "tuna", "shrimp", "pasta", "noodles",
+    "soup", "stew", "casserole", "slow cooker", "crockpot", "roast",
+    "grilled", "bbq", "barbecue", "breakfast", "lunch", "dinner",
+    "main course", "side dish", "appetizer", "starter", "entree",
+    "pizza", "burger", "wrap", "quesadilla", "tacos", "enchiladas"
+)
+
+
+def compile_keyword_pattern(keywords) -> re.Pattern:
+    """
+    Compile keywords into one alternation that matches any of them as a substring.
+    
+    pattern.search(text) is equivalent to any(keyword in text for keyword in keywords)
+    but scans the text once in C instead of once per keyword in Python.
+    
+    Args:
+        keywords: Lowercase keywords to match
+        
+    Returns:
+        re.Pattern: Compiled alternation of the escaped keywords
+    """
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+
+# Each keyword list as one alternation, matched as substrings like the lists themselves
+JAM_KEYWORD_PATTERN = compile_keyword_pattern(JAM_KEYWORDS)
+JAM_INGREDIENT_PATTERN = compile_keyword_pattern(JAM_INGREDIENTS)
+JAM_MAKING_INGREDIENT_PATTERN = compile_keyword_pattern(JAM_MAKING_INGREDIENTS)
+NON_JAM_PATTERN = compile_keyword_pattern(NON_JAM_KEYWORDS)
+
+# "jam" as a whole word in an ingredient name
+JAM_WORD_PATTERN = re.compile(r'\bjam\b')
+
+
+def has_jam_keyword(title: str, description: str = "") -> bool:
+    """
+    Check whether a title or description mentions jam at all.
+    
+    This is the first test in is_jam_recipe, exposed so adapters can reject
+    a page before extracting the rest of the recipe.
+    
+    Args:
+        title: Recipe title
+        description: Recipe description
+        
+    Returns:
+        bool: True if a jam-related keyword appears in either
+    """
+    return (
+        JAM_KEYWORD_PATTERN.search(title.lower()) is not None or
+        JAM_KEYWORD_PATTERN.search(description.lower()) is not None
+    )
+
+
 def is_jam_recipe(recipe_data: Dict[str, Any]) -> bool:
     """
     Validate that a recipe is actually a jam recipe using shared logic.
@@ -25,22 +105,27 @@ def is_jam_recipe(recipe_data: Dict[str, Any]) -> bool:
     Returns:
         bool: True if this is a jam recipe, False otherwise
     """
+    # Cheapest checks first, so most rejected recipes never reach the ingredients
+    
+    # 5. Check for valid rating (not zero or missing)
+    rating = recipe_data.get("rating")
+    if rating is None or rating == 0 or rating == 0.0:
+        return False
+    
+    # 4. Check for non-jam indicators in title
     title = recipe_data.get("title", "").lower()
-    description = recipe_data.get("description", "").lower()
-    ingredients = recipe_data.get("ingredients", [])
+    if NON_JAM_PATTERN.search(title):
+        return False
     
     # 1. Check for jam-related keywords in title or description
-    jam_keywords = ["jam", "jelly", "preserve", "marmalade", "conserve"]
-    has_jam_keyword = (
-        any(keyword in title for keyword in jam_keywords) or
-        any(keyword in description for keyword in jam_keywords)
-    )
-    
-    if not has_jam_keyword:
+    description = recipe_data.get("description", "").lower()
+    if not has_jam_keyword(title, description):
         return False
     
-    # 2. Check for jam-making ingredients
-    jam_ingredients = ["sugar", "pectin", "lemon juice", "lime juice", "citric acid"]
+    ingredients = recipe_data.get("ingredients", [])
+    
+    # 2 & 3. One pass over the ingredients: it needs jam-making ingredients, and
+    # must NOT have "jam" as an ingredient (recipes that USE jam, not MAKE jam)
     has_jam_ingredients = False
     
     for ingredient in ingredients:
@@ -48,71 +133,20 @@ def is_jam_recipe(recipe_data: Dict[str, Any]) -> bool:
             ingredient_name = ingredient.get("name", "").lower()
         else:
             ingredient_name = str(ingredient).lower()
-            
-        if any(jam_ing in ingredient_name for jam_ing in jam_ingredients):
+        
+        if not has_jam_ingredients and JAM_INGREDIENT_PATTERN.search(ingredient_name):
             has_jam_ingredients = True
-            break
-    
-    if not has_jam_ingredients:
-        return False
-    
-    # 3. Check if recipe has "jam" as an ingredient (recipes that USE jam, not MAKE jam)
-    # But exclude legitimate jam-making ingredients like "jam sugar"
-    has_jam_as_ingredient = False
-    jam_making_ingredients = ["jam sugar", "jam sugar", "preserving sugar", "jam setting sugar"]
-    
-    for ingredient in ingredients:
-        if isinstance(ingredient, dict):
-            ingredient_name = ingredient.get("name", "").lower()
-        else:
-            ingredient_name = str(ingredient).lower()
-            
-        # Check if this is a jam-making ingredient (legitimate)
-        is_jam_making_ingredient = any(jam_ing in ingredient_name for jam_ing in jam_making_ingredients)
         
-        # Look for "jam" as a standalone word or in phrases like "strawberry jam"
-        # but only if it's not a jam-making ingredient
-        if "jam" in ingredient_name and not is_jam_making_ingredient:
-            # Use regex to find "jam" as a whole word
-            import re
-            if re.search(r'\bjam\b', ingredient_name):
-                has_jam_as_ingredient = True
-                break
-    
-    if has_jam_as_ingredient:
-        return False
-    
-    # 4. Check for non-jam indicators in title
-    non_jam_keywords = [
-        "cake", "cupcake", "muffin", "bread", "cookie", "pie", "tart",
-        "sandwich", "toast", "pancake", "waffle", "crepe", "danish",
-        "cheesecake", "trifle", "parfait", "sundae", "milkshake",
-        "smoothie", "cocktail", "sauce", "glaze", "frosting", "icing",
-        "filling", "topping", "spread", "dip", "salad", "dressing",
-        "marinade", "rub", "seasoning", "garnish", "popsicle", "frozen",
-        "ice cream", "sorbet", "granita", "sherbet", "bar", "bars",
-        "doughnut", "doughnuts", "donut", "donuts", "crostata", "tarts",
-        "pastry", "pastries", "scuffin", "roll", "egg roll", "fried",
-        "baked", "oven", "flour", "baking powder", "baking soda", "yeast",
-        "dough", "drink", "beverage", "mocktail", "juice",
-        # Additional non-jam indicators
-        "sponge", "scones", "scone", "baguette", "turnovers", "turnover",
-        "board", "grazing", "chicken", "thighs", "rice", "peas", "beef",
-        "pork", "fish", "salmon", "tuna", "shrimp", "pasta", "noodles",
-        "soup", "stew", "casserole", "slow cooker", "crockpot", "roast",
-        "grilled", "bbq", "barbecue", "breakfast", "lunch", "dinner",
-        "main course", "side dish", "appetizer", "starter", "entree",
-        "pizza", "burger", "wrap", "quesadilla", "tacos", "enchiladas"
-    ]
-    
-    has_non_jam_indicators = any(keyword in title for keyword in non_jam_keywords)
-    
-    if has_non_jam_indicators:
-        return False
+        # Look for "jam" as a whole word (e.g. "strawberry jam"), but exclude
+        # legitimate jam-making ingredients like "jam sugar"
+        if (
+            "jam" in ingredient_name and
+            not JAM_MAKING_INGREDIENT_PATTERN.search(ingredient_name) and
+            JAM_WORD_PATTERN.search(ingredient_name)
+        ):
+            return False
     
-    # 5. Check for valid rating (not zero or missing)
-    rating = recipe_data.get("rating")
-    if rating is None or rating == 0 or rating == 0.0:
+    if not has_jam_ingredients:
         return False
     
     # If we get here, it's a valid jam recipe
@@ -0,0 +1,61 @@
+"""
+Priority-ordered CSS selector groups shared by the site adapters.
+
+Adapters try a list of selectors in order and use the first one that matches.
+Running each selector separately walks the whole page once per selector; a
+selector group walks it once with the combined selector and then ranks the
+(few) matched elements against the individual selectors, so the first
+matching selector still wins.
+"""
+
+from typing import Any, Iterator, List, Tuple, Union
+
+import soupsieve
+
+
+SelectorGroup = Tuple[Any, List[Any]]
+
+
+def compile_selector_group(selectors: List[str]) -> SelectorGroup:
+    """
+    Compile a priority-ordered list of CSS selectors.
+
+    Args:
+        selectors (List[str]): CSS selectors, most preferred first
+
+    Returns:
+        SelectorGroup: The combined selector (one tree walk for all of them)
+        and the individual selectors used to rank the matches it returns
+    """
+    combined = soupsieve.compile(', '.join(selectors))
+    ranked = [soupsieve.compile(selector) for selector in selectors]
+    return combined, ranked
+
+
+def select_by_priority(soup: Any, selector_group: SelectorGroup,
+                       with_selectors: bool = False) -> Iterator[Union[List[Any], Tuple[str, List[Any]]]]:
+    """
+    Yield the matches of each selector in a group, in priority order.
+
+    Selectors with no matches are skipped, so the first value yielded is what
+    the first matching selector would have returned from soup.select().
+
+    Args:
+        soup: Parsed page (BeautifulSoup or any Tag)
+        selector_group (SelectorGroup): Result of compile_selector_group()
+        with_selectors (bool): Yield (selector text, matches) pairs instead of
+            just the matches, e.g. to log which selector won
+
+    Yields:
+        List: Elements matched by the next selector that matched anything,
+        or a (str, List) pair when with_selectors is set
+    """
+    combined, ranked = selector_group
+    candidates = combined.select(soup)
+    if not candidates:
+        return
+
+    for selector in ranked:
+        matches = [elem for elem in candidates if selector.match(elem)]
+        if matches:
+            yield (selector.pattern, matches) if with_selectors else matches
@@ -5,7 +5,14 @@ This module extends the BaseScraper to handle JavaScript-rendered content using
 It provides browser automation capabilities for modern websites that require JavaScript execution.
 """
 
+import hashlib
+import logging
+import os
+import queue
+import shutil
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -16,9 +23,41 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 
-from scraper.core.base_scraper import BaseScraper
+# Profile directories are claimed with an advisory file lock where the
+# platform supports it; without it every browser gets a temporary profile
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from scraper.core.base_scraper import BaseScraper, PAGE_CACHE_DIR, PAGE_CACHE_EXPIRY_SECONDS
 from scraper.adapters.base_adapter import BaseAdapter
 
+logger = logging.getLogger(__name__)
+
+# Requests the browser never makes - only the DOM is scraped, so images, fonts,
+# stylesheets and trackers are wasted bandwidth and load time
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.css",
+    "*gtag*", "*analytics*", "*doubleclick*",
+]
+
+# Browsers loading recipe pages at the same time
+DEFAULT_DRIVER_POOL_SIZE = 4
+
+# Chrome profiles kept between runs (one per pooled browser, since Chrome locks
+# a profile while it is open), so the HTTP and DNS caches start warm. A profile
+# already in use by another scraper or process falls back to a temporary one.
+CHROME_PROFILE_DIR = os.path.join(PAGE_CACHE_DIR, 'chrome-profile')
+
+# ChromeDriver binary resolved by ChromeDriverManager, shared by every
+# scraper in the process (install() checks versions over the network)
+_driver_path = None
+
+# How often to re-check for a waited-for element (Selenium's default is 0.5s)
+WAIT_POLL_SECONDS = 0.05
+
 
 class SeleniumScraper(BaseScraper):
     """
@@ -28,7 +67,8 @@ class SeleniumScraper(BaseScraper):
     JavaScript execution to load content dynamically.
     """
     
-    def __init__(self, rate_limit: float = 0.3, headless: bool = True, wait_timeout: int = 10):
+    def __init__(self, rate_limit: float = 0.3, headless: bool = True, wait_timeout: int = 10,
+                 pool_size: int = DEFAULT_DRIVER_POOL_SIZE):
         """
         Initialize the Selenium scraper.
         
@@ -36,15 +76,38 @@ class SeleniumScraper(BaseScraper):
             rate_limit (float): Time to wait between requests in seconds
             headless (bool): Whether to run browser in headless mode
             wait_timeout (int): Maximum time to wait for elements to load
+            pool_size (int): Number of browsers loading pages concurrently
         """
-        super().__init__(rate_limit)
+        super().__init__(rate_limit, max_workers=pool_size)
         self.headless = headless
         self.wait_timeout = wait_timeout
-        self.driver = None
-        self._setup_driver()
+        self.drivers = []
+        # Drivers not currently loading a page; get_page_html borrows one at a time
+        self._idle_drivers = queue.Queue()
+        # Open lock files holding our persistent profiles, and temporary
+        # profiles to delete, both released in close()
+        self._profile_locks = []
+        self._temp_profile_dirs = []
+        
+        try:
+            for profile_index in range(pool_size):
+                driver = self._setup_driver(profile_index)
+                self.drivers.append(driver)
+                self._idle_drivers.put(driver)
+        except Exception:
+            self.close()
+            raise
     
-    def _setup_driver(self):
-        """Set up the Chrome WebDriver with appropriate options."""
+    def _setup_driver(self, profile_index: int = 0):
+        """
+        Set up a Chrome WebDriver with appropriate options.
+        
+        Args:
+            profile_index (int): Which persistent profile directory the browser uses
+            
+        Returns:
+            webdriver.Chrome: The new driver
+        """
         try:
             chrome_options = Options()
             
@@ -58,20 +121,67 @@ class SeleniumScraper(BaseScraper):
             chrome_options.add_argument("--window-size=1920,1080")
             chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
             
-            # Disable images and CSS for faster loading (optional)
-            # chrome_options.add_argument("--disable-images")
-            # chrome_options.add_argument("--disable-css")
+            # Reuse the profile from earlier runs instead of a fresh temporary one
+            profile_dir = self._claim_profile_dir(profile_index)
+            chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+            
+            # Don't load images (the DOM still has their URLs)
+            chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
             
-            # Set up ChromeDriver
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            # Set up ChromeDriver (resolved once per process)
+            global _driver_path
+            if _driver_path is None:
+                _driver_path = ChromeDriverManager().install()
+            service = Service(_driver_path)
+            driver = webdriver.Chrome(service=service, options=chrome_options)
             
             # Set page load timeout
-            self.driver.set_page_load_timeout(30)
+            driver.set_page_load_timeout(30)
+            
+            # Block resources that are only needed for rendering (applies to every page load)
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+            
+            return driver
             
         except Exception as e:
             raise Exception(f"Failed to set up Chrome WebDriver: {e}")
     
+    def _claim_profile_dir(self, profile_index: int) -> str:
+        """
+        Lock a persistent profile directory for one browser in the pool.
+        
+        Chrome refuses to open a profile another browser is using, so when
+        another scraper (in this or another process) holds the persistent
+        profile, a temporary one is used instead.
+        
+        Args:
+            profile_index (int): Which persistent profile directory to try
+            
+        Returns:
+            str: The profile directory to pass as --user-data-dir
+        """
+        profile_dir = os.path.abspath(os.path.join(CHROME_PROFILE_DIR, str(profile_index)))
+        if fcntl is not None:
+            try:
+                os.makedirs(CHROME_PROFILE_DIR, exist_ok=True)
+                lock_file = open(profile_dir + '.lock', 'w')
+            except OSError as e:
+                logger.warning("Could not lock Chrome profile %s: %s", profile_dir, e)
+            else:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    lock_file.close()
+                else:
+                    self._profile_locks.append(lock_file)
+                    return profile_dir
+        
+        temp_dir = tempfile.mkdtemp(prefix='jam-chrome-profile-')
+        self._temp_profile_dirs.append(temp_dir)
+        logger.debug("Chrome profile %s is in use, using %s", profile_dir, temp_dir)
+        return temp_dir
+    
     def get_page_html(self, url: str, wait_for_element: Optional[str] = None) -> str:
         """
         Get HTML content from a URL using Selenium.
@@ -83,41 +193,88 @@ class SeleniumScraper(BaseScraper):
         Returns:
             str: The HTML content of the page
         """
+        cached_html = self._get_cached_html(url)
+        if cached_html is None:
+            cached_html = self._read_page_cache(url)
+        if cached_html is not None:
+            return cached_html
+        
+        self._wait_for_rate_limit(url)
+        driver = self._idle_drivers.get()
         try:
-            self.driver.get(url)
+            # Returns once the page has loaded
+            driver.get(url)
             
-            # Wait for specific element if provided
+            # Wait for dynamically rendered content, returning as soon as it appears
+            # (instead of fixed sleeps on every page)
             if wait_for_element:
-                wait = WebDriverWait(self.driver, self.wait_timeout)
+                wait = WebDriverWait(driver, self.wait_timeout, poll_frequency=WAIT_POLL_SECONDS)
                 wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, wait_for_element)))
             
-            # Wait longer for search results to load dynamically
-            print("Waiting for search results to load...")
-            time.sleep(5)  # Give more time for dynamic content
-            
-            # Try to wait for search results specifically
-            try:
-                # Wait for recipe cards or search results to appear
-                wait = WebDriverWait(self.driver, 10)
-                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='recipe-card'], .recipe-card, div[class*='recipe'], .search-results, .results")))
-                print("✅ Search results detected")
-            except TimeoutException:
-                print("⚠️  Search results may not have loaded completely")
-            
-            # Additional wait for any remaining JavaScript
-            time.sleep(3)
-            
-            return self.driver.page_source
+            html = driver.page_source
+            self._cache_html(url, html)
+            self._write_page_cache(url, html)
+            return html
             
         except TimeoutException:
-            print(f"Timeout waiting for element {wait_for_element} on {url}")
-            return self.driver.page_source
+            logger.warning("Timeout waiting for element %s on %s", wait_for_element, url)
+            return driver.page_source
         except WebDriverException as e:
-            print(f"WebDriver error on {url}: {e}")
+            logger.error("WebDriver error on %s: %s", url, e)
             raise
         except Exception as e:
-            print(f"Unexpected error on {url}: {e}")
+            logger.error("Unexpected error on %s: %s", url, e)
             raise
+        finally:
+            self._idle_drivers.put(driver)
+    
+    def fetch_html(self, url: str) -> str:
+        """
+        Get the rendered HTML of a recipe page (used by the recipe workers).
+        
+        Args:
+            url (str): The URL to load
+            
+        Returns:
+            str: The HTML content of the page
+        """
+        return self.get_page_html(url, wait_for_element="body")
+    
+    def _page_cache_path(self, url: str) -> str:
+        """Return the on-disk cache file for a URL."""
+        return os.path.join(PAGE_CACHE_DIR, 'selenium', hashlib.sha1(url.encode()).hexdigest() + '.html')
+    
+    def _read_page_cache(self, url: str) -> Optional[str]:
+        """
+        Return the rendered HTML saved by an earlier run, if it is still fresh.
+        
+        Args:
+            url (str): The page URL
+            
+        Returns:
+            Optional[str]: The cached HTML, or None if missing or expired
+        """
+        path = self._page_cache_path(url)
+        try:
+            if time.time() - os.path.getmtime(path) > PAGE_CACHE_EXPIRY_SECONDS:
+                return None
+            with open(path, encoding='utf-8') as cache_file:
+                html = cache_file.read()
+        except OSError:
+            return None
+        
+        self._cache_html(url, html)
+        return html
+    
+    def _write_page_cache(self, url: str, html: str):
+        """Save rendered HTML for later runs (a failed write only costs a reload)."""
+        path = self._page_cache_path(url)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as cache_file:
+                cache_file.write(html)
+        except OSError as e:
+            logger.warning("Could not cache page %s: %s", url, e)
     
     def scrape_site_with_selenium(self, adapter: BaseAdapter, fruit_name: str) -> List[Dict[str, Any]]:
         """
@@ -130,64 +287,59 @@ class SeleniumScraper(BaseScraper):
         Returns:
             List[Dict[str, Any]]: List of scraped recipe data
         """
-        print(f"Scraping {adapter.get_site_name()} for {fruit_name} recipes using Selenium...")
+        logger.info("Scraping %s for %s recipes using Selenium...", adapter.get_site_name(), fruit_name)
         
         try:
             # Step 1: Get search URL from adapter
             search_url = adapter.search_for_fruit(fruit_name)
-            print(f"Search URL: {search_url}")
+            logger.debug("Search URL: %s", search_url)
             
             # Step 2: Get search results HTML using Selenium
-            print("Loading search results with Selenium...")
+            logger.debug("Loading search results with Selenium...")
             # Wait for search results to load - try multiple possible elements
-            search_html = self.get_page_html(search_url, wait_for_element="[data-testid='recipe-card'], .recipe-card, div[class*='recipe'], .search-results")
-            print(f"Search request successful, got {len(search_html)} characters")
+            search_html = self.get_page_html(search_url, wait_for_element="[data-testid='recipe-card'], .recipe-card, div[class*='recipe'], .search-results, .results")
+            logger.debug("Search request successful, got %d characters", len(search_html))
             
             # Step 3: Get recipe URLs from adapter
-            recipe_urls = adapter.get_recipe_urls(search_html)
-            print(f"Found {len(recipe_urls)} recipe URLs")
+            recipe_urls = self._unique_urls(adapter.get_recipe_urls(search_html))
+            logger.info("Found %d recipe URLs", len(recipe_urls))
             
             if not recipe_urls:
-                print("No recipe URLs found. The site might use different selectors or require different wait conditions.")
+                logger.warning("No recipe URLs found. The site might use different selectors or require different wait conditions.")
                 return []
             
-            # Step 4: Scrape each recipe
-            recipes = []
-            for i, recipe_url in enumerate(recipe_urls):
-                print(f"Scraping recipe {i+1}/{len(recipe_urls)}: {recipe_url}")
-                
-                try:
-                    # Get recipe page HTML using Selenium
-                    recipe_html = self.get_page_html(recipe_url, wait_for_element="body")
-                    
-                    # Extract recipe data using adapter
-                    recipe_data = adapter.extract_recipe_data(recipe_html, recipe_url)
-                    recipes.append(recipe_data)
-                    
-                    print(f"Successfully scraped recipe: {recipe_data.get('title', 'Unknown')}")
-                    
-                    # Rate limiting
-                    if i < len(recipe_urls) - 1:  # Don't wait after the last request
-                        time.sleep(self.rate_limit)
-                        
-                except Exception as e:
-                    print(f"Error scraping recipe {recipe_url}: {e}")
-                    continue
-            
-            print(f"Selenium scraping complete. Got {len(recipes)} recipes from {adapter.get_site_name()}")
+            # Step 4: Scrape recipes on all browsers in the pool at once (results keep the search order)
+            with ThreadPoolExecutor(max_workers=len(self.drivers)) as executor:
+                futures = [
+                    executor.submit(self._scrape_recipe, adapter, recipe_url, i, len(recipe_urls))
+                    for i, recipe_url in enumerate(recipe_urls)
+                ]
+                results = [future.result() for future in futures]
+            recipes = [recipe_data for recipe_data in results if recipe_data is not None]
+            
+            logger.info("Selenium scraping complete. Got %d recipes from %s", len(recipes), adapter.get_site_name())
             return recipes
             
         except Exception as e:
-            print(f"Error in Selenium scraping: {e}")
+            logger.error("Error in Selenium scraping: %s", e)
             return []
     
     def close(self):
-        """Close the WebDriver and clean up resources."""
-        if self.driver:
+        """Close every WebDriver in the pool and clean up resources (safe to call more than once)."""
+        drivers, self.drivers = self.drivers, []
+        for driver in drivers:
             try:
-                self.driver.quit()
+                driver.quit()
             except Exception as e:
-                print(f"Error closing WebDriver: {e}")
+                logger.warning("Error closing WebDriver: %s", e)
+        
+        # Release profiles only once their browsers have exited
+        profile_locks, self._profile_locks = self._profile_locks, []
+        for lock_file in profile_locks:
+            lock_file.close()
+        temp_profile_dirs, self._temp_profile_dirs = self._temp_profile_dirs, []
+        for temp_dir in temp_profile_dirs:
+            shutil.rmtree(temp_dir, ignore_errors=True)
     
     def __enter__(self):
         """Context manager entry."""
@@ -5,6 +5,8 @@ This module provides mappings from various fruit name variations to standardized
 AI model names. Covers traditional jam fruits with regional variations.
 """
 
+from functools import lru_cache
+
 # Comprehensive fruit mapping dictionary
 # Key: standardized AI name
 # Value: dictionary with variations and AI name
@@ -266,6 +268,15 @@ FRUIT_MAP = {
     }
 }
 
+@lru_cache(maxsize=None)
+def _variation_map():
+    """Build the variation -> ai_name map once (FRUIT_MAP never changes at runtime)."""
+    variation_map = {}
+    for ai_name, fruit_data in FRUIT_MAP.items():
+        for variation in fruit_data["variations"]:
+            variation_map[variation.lower()] = ai_name
+    return variation_map
+
 def get_fruit_variations():
     """
     Get all fruit variations as a flat list for easy searching.
@@ -273,11 +284,8 @@ def get_fruit_variations():
     Returns:
         dict: Dictionary mapping variation -> ai_name
     """
-    variation_map = {}
-    for ai_name, fruit_data in FRUIT_MAP.items():
-        for variation in fruit_data["variations"]:
-            variation_map[variation.lower()] = ai_name
-    return variation_map
+    # A copy, so callers can't change the shared map
+    return dict(_variation_map())
 
 def get_ai_name_for_variation(variation):
     """
@@ -289,8 +297,7 @@ def get_ai_name_for_variation(variation):
     Returns:
         str: The standardized AI name, or None if not found
     """
-    variation_map = get_fruit_variations()
-    return variation_map.get(variation.lower())
+    return _variation_map().get(variation.lower())
 
 def get_all_ai_names():
     """
@@ -311,7 +318,7 @@ def extract_fruits_from_text(text):
     Returns:
         list: List of unique AI names found in the text
     """
-    variation_map = get_fruit_variations()
+    variation_map = _variation_map()
     found_fruits = set()
     
     text_lower = text.lower()
@@ -18,6 +18,8 @@ load_dotenv()
 # Add the parent directory to the Python path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
+from scraper.core.adaptive_scraper import AdaptiveScraper
+from scraper.core.logging_setup import configure_logging
 from scraper.scripts.scrape_jam_multi_source import scrape_jam_multi_source
 from scraper.scripts.insert_recipes import connect_to_database
 from scraper.scripts.post_process_recipes import post_process_recipes
@@ -100,27 +102,30 @@ def scrape_all_fruits(sources: List[str] = None, recipes_per_source: int = 5,
     results = {}
     total_recipes = 0
     
-    for i, fruit in enumerate(fruits, 1):
-        print(f"\n[{get_timestamp()}] 🍓 Scraping {fruit} ({i}/{len(fruits)})")
-        print(f"[{get_timestamp()}] {'='*50}")
-        
-        try:
-            recipe_ids = scrape_jam_multi_source(
-                fruit_name=fruit,
-                sources=sources,
-                recipes_per_source=recipes_per_source
-            )
-            
-            results[fruit] = recipe_ids
-            total_recipes += len(recipe_ids)
+    # One scraper (and browser) for the whole batch instead of one per fruit
+    with AdaptiveScraper(headless=True) as scraper:
+        for i, fruit in enumerate(fruits, 1):
+            print(f"\n[{get_timestamp()}] 🍓 Scraping {fruit} ({i}/{len(fruits)})")
+            print(f"[{get_timestamp()}] {'='*50}")
             
-            print(f"[{get_timestamp()}] ✅ {fruit}: {len(recipe_ids)} recipes inserted")
-            
-        except Exception as e:
-            print(f"[{get_timestamp()}] ❌ {fruit}: Failed - {e}")
-            results[fruit] = []
-            continue
-    
+            try:
+                recipe_ids = scrape_jam_multi_source(
+                    fruit_name=fruit,
+                    sources=sources,
+                    recipes_per_source=recipes_per_source,
+                    scraper=scraper
+                )
+                
+                results[fruit] = recipe_ids
+                total_recipes += len(recipe_ids)
+                
+                print(f"[{get_timestamp()}] ✅ {fruit}: {len(recipe_ids)} recipes inserted")
+                
+            except Exception as e:
+                print(f"[{get_timestamp()}] ❌ {fruit}: Failed - {e}")
+                results[fruit] = []
+                continue
+        
     # Summary
     print(f"\n[{get_timestamp()}] 🎉 Batch scraping complete!")
     print(f"[{get_timestamp()}] {'='*50}")
@@ -164,6 +169,7 @@ def main():
     parser.add_argument("--verbose", "-v", action="store_true", help="Show verbose output")
     
     args = parser.parse_args()
+    configure_logging(verbose=args.verbose)
     
     print(f"[{get_timestamp()}] Batch fruit scraper starting...")
     print(f"[{get_timestamp()}] Sources: {', '.join(args.sources)}")
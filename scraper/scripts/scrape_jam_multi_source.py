@@ -9,6 +9,7 @@ from multiple sources (AllRecipes, Serious Eats, etc.) and inserting them into t
 import sys
 import os
 import argparse
+from contextlib import nullcontext
 from typing import List, Dict, Any
 from dotenv import load_dotenv
 
@@ -19,6 +20,7 @@ load_dotenv()
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
 from scraper.core.adaptive_scraper import AdaptiveScraper
+from scraper.core.logging_setup import configure_logging
 from scraper.adapters.allrecipes_adapter import AllRecipesAdapter
 from scraper.adapters.serious_eats_adapter import SeriousEatsAdapter
 from scraper.adapters.food_network_adapter import FoodNetworkAdapter
@@ -30,7 +32,8 @@ def get_timestamp():
     from datetime import datetime
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-def scrape_jam_multi_source(fruit_name: str, sources: List[str] = None, recipes_per_source: int = 10) -> List[int]:
+def scrape_jam_multi_source(fruit_name: str, sources: List[str] = None, recipes_per_source: int = 10,
+                            scraper: AdaptiveScraper = None) -> List[int]:
     """
     Scrape jam recipes from multiple sources for a specific fruit and insert into database.
     
@@ -38,6 +41,7 @@ def scrape_jam_multi_source(fruit_name: str, sources: List[str] = None, recipes_
         fruit_name (str): The fruit to search for (e.g., "strawberry")
         sources (List[str]): List of sources to scrape from (default: ["allrecipes", "serious_eats"])
         recipes_per_source (int): Number of recipes to scrape from each source (default: 10)
+        scraper (AdaptiveScraper): Open scraper to reuse across fruits (default: create and close one)
         
     Returns:
         List[int]: List of recipe IDs inserted into database
@@ -55,9 +59,10 @@ def scrape_jam_multi_source(fruit_name: str, sources: List[str] = None, recipes_
     all_scraped_recipes = []
     
     try:
-        # Step 1: Initialize adaptive scraper
+        # Step 1: Initialize adaptive scraper (a caller-owned scraper stays open afterwards)
         print(f"[{get_timestamp()}] Step 1: Initializing adaptive scraper...")
-        with AdaptiveScraper(headless=True) as scraper:
+        scraper_context = AdaptiveScraper(headless=True) if scraper is None else nullcontext(scraper)
+        with scraper_context as scraper:
             print(f"[{get_timestamp()}] ✅ Adaptive scraper initialized")
             
             # Step 2: Scrape from each source
@@ -162,6 +167,7 @@ def main():
     parser.add_argument("--verbose", "-v", action="store_true", help="Show verbose output")
     
     args = parser.parse_args()
+    configure_logging(verbose=args.verbose)
     
     print(f"[{get_timestamp()}] Multi-source jam scraper starting...")
     print(f"[{get_timestamp()}] Fruit: {args.fruit}")
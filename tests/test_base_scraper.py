@@ -0,0 +1,220 @@
+"""
+Tests for BaseScraper page fetching.
+"""
+
+import threading
+import time
+import unittest
+from typing import Any, Dict, List
+from unittest import mock
+
+import requests
+
+from scraper.adapters.base_adapter import BaseAdapter
+from scraper.core import base_scraper
+from scraper.core.base_scraper import BaseScraper, RATE_LIMIT_BURST
+
+
+def make_response(body: bytes, content_type: str = 'text/html') -> requests.Response:
+    """Build a 200 response with the given body and Content-Type."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.headers['Content-Type'] = content_type
+    return response
+
+
+class DecodeHtmlTest(unittest.TestCase):
+    """Pages are decoded with the charset they declare, wherever they declare it."""
+    
+    def setUp(self):
+        self.scraper = BaseScraper()
+    
+    def test_header_charset(self):
+        response = make_response('<p>café</p>'.encode('latin-1'), 'text/html; charset=ISO-8859-1')
+        self.assertEqual(self.scraper._decode_html(response), '<p>café</p>')
+    
+    def test_meta_charset(self):
+        response = make_response('<meta charset="windows-1252"><p>“café”</p>'.encode('cp1252'))
+        self.assertEqual(self.scraper._decode_html(response), '<meta charset="windows-1252"><p>“café”</p>')
+    
+    def test_meta_http_equiv_charset(self):
+        page = '<meta http-equiv="Content-Type" content="text/html; charset=ISO-8859-1"><p>café</p>'
+        response = make_response(page.encode('latin-1'))
+        self.assertEqual(self.scraper._decode_html(response), page)
+    
+    def test_undeclared_utf8(self):
+        response = make_response('<p>café</p>'.encode('utf-8'))
+        self.assertEqual(self.scraper._decode_html(response), '<p>café</p>')
+
+
+class FakeClock:
+    """
+    Stand-in for the time module that never really sleeps.
+    
+    The clock stays still; each thread's pending sleep is remembered so the
+    fake session can tell when that thread's request would have started.
+    """
+    
+    def __init__(self):
+        self.now = 0.0
+        self._pending = threading.local()
+    
+    def monotonic(self) -> float:
+        return self.now
+    
+    def sleep(self, seconds: float):
+        self._pending.delay = getattr(self._pending, 'delay', 0.0) + seconds
+    
+    def start_time(self) -> float:
+        """Time the calling thread's request starts, clearing its pending sleep."""
+        delay = getattr(self._pending, 'delay', 0.0)
+        self._pending.delay = 0.0
+        return self.now + delay
+
+
+class FakeSession:
+    """Session answering every GET with a page, recording when each one started."""
+    
+    def __init__(self, clock: FakeClock, statuses: List[int] = None, retry_after: str = ''):
+        self.clock = clock
+        self.statuses = list(statuses or [])
+        self.retry_after = retry_after
+        self.requests = []
+        self._lock = threading.Lock()
+    
+    def get(self, url: str) -> requests.Response:
+        start_time = self.clock.start_time()
+        with self._lock:
+            self.requests.append((start_time, url))
+            status = self.statuses.pop(0) if self.statuses else 200
+        response = make_response(f'<p>{url}</p>'.encode('utf-8'))
+        response.status_code = status
+        if status != 200 and self.retry_after:
+            response.headers['Retry-After'] = self.retry_after
+        return response
+
+
+class FakeAdapter(BaseAdapter):
+    """Adapter whose search page lists fixed URLs and whose recipes echo their URL."""
+    
+    def __init__(self, recipe_urls: List[str], slow_urls: Dict[str, float] = None):
+        self.recipe_urls = recipe_urls
+        self.slow_urls = slow_urls or {}
+    
+    def get_site_name(self) -> str:
+        return "Fake Site"
+    
+    def search_for_fruit(self, fruit_name: str) -> str:
+        return f"https://search.example.com/?q={fruit_name}"
+    
+    def get_recipe_urls(self, search_results_html: str) -> List[str]:
+        return list(self.recipe_urls)
+    
+    def extract_recipe_data(self, recipe_html: str, recipe_url: str) -> Dict[str, Any]:
+        # Hold some workers back so they finish out of search order
+        time.sleep(self.slow_urls.get(recipe_url, 0.0))
+        if 'broken' in recipe_url:
+            raise ValueError("not a jam recipe")
+        return {'title': recipe_url, 'source_url': recipe_url}
+    
+    def extract_fruits_from_ingredients(self, ingredients: List[str]) -> List[str]:
+        return []
+
+
+class RateLimitTest(unittest.TestCase):
+    """Requests to one host never outpace its token bucket, whatever the workers do."""
+    
+    RATE_LIMIT = 0.5
+    
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.object(base_scraper, 'time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.scraper = BaseScraper(rate_limit=self.RATE_LIMIT, max_workers=8)
+    
+    def assert_within_bucket(self, start_times: List[float]):
+        """Any run of n requests must span at least (n - burst) * rate_limit seconds."""
+        start_times = sorted(start_times)
+        for first in range(len(start_times)):
+            for last in range(first + RATE_LIMIT_BURST, len(start_times)):
+                allowed_gap = (last - first + 1 - RATE_LIMIT_BURST) * self.RATE_LIMIT
+                self.assertGreaterEqual(start_times[last] - start_times[first], allowed_gap - 1e-9)
+    
+    def test_concurrent_requests_to_one_host(self):
+        self.scraper.session = FakeSession(self.clock)
+        recipe_urls = [f"https://recipes.example.com/jam-{i}" for i in range(12)]
+        
+        self.scraper.scrape_site(FakeAdapter(recipe_urls), "strawberry")
+        
+        start_times = [start for start, url in self.scraper.session.requests if 'recipes.' in url]
+        self.assertEqual(len(start_times), 12)
+        self.assert_within_bucket(start_times)
+        # The burst goes out at once, then one request per rate_limit
+        self.assertEqual(sorted(start_times)[RATE_LIMIT_BURST - 1], 0.0)
+        self.assertAlmostEqual(max(start_times), (12 - RATE_LIMIT_BURST) * self.RATE_LIMIT)
+    
+    def test_hosts_have_separate_buckets(self):
+        self.scraper.session = FakeSession(self.clock)
+        
+        for i in range(RATE_LIMIT_BURST):
+            self.scraper.fetch_html(f"https://a.example.com/{i}")
+        self.scraper.fetch_html("https://b.example.com/0")
+        
+        self.assertEqual(self.scraper.session.requests[-1][0], 0.0)
+    
+    def test_throttled_host_backs_off(self):
+        self.scraper.session = FakeSession(self.clock, statuses=[429], retry_after='5')
+        
+        self.scraper.fetch_html("https://recipes.example.com/jam-0")
+        self.scraper.fetch_html("https://recipes.example.com/jam-1")
+        
+        (throttled, _), (retry, _), (next_request, _) = self.scraper.session.requests
+        self.assertEqual(throttled, 0.0)
+        self.assertGreaterEqual(retry, 5.0)
+        self.assertGreaterEqual(next_request, retry)
+
+
+class ScrapeSiteTest(unittest.TestCase):
+    """Concurrent recipe fetches come back deduplicated and in search order."""
+    
+    def setUp(self):
+        self.scraper = BaseScraper(rate_limit=0.0, max_workers=4)
+        self.scraper.session = FakeSession(FakeClock())
+    
+    def test_results_keep_search_order(self):
+        recipe_urls = [f"https://recipes.example.com/jam-{i}" for i in range(6)]
+        # Earlier recipes finish last
+        slow_urls = {url: 0.05 * (len(recipe_urls) - i) for i, url in enumerate(recipe_urls)}
+        
+        recipes = self.scraper.scrape_site(FakeAdapter(recipe_urls, slow_urls), "strawberry")
+        
+        self.assertEqual([recipe['source_url'] for recipe in recipes], recipe_urls)
+    
+    def test_duplicate_urls_fetched_once(self):
+        recipe_urls = [
+            "https://recipes.example.com/jam-0",
+            "https://RECIPES.example.com/jam-0/",
+            "https://recipes.example.com/jam-1",
+            "https://recipes.example.com/jam-0#reviews",
+            "https://recipes.example.com/broken",
+            "https://recipes.example.com/jam-2",
+        ]
+        
+        recipes = self.scraper.scrape_site(FakeAdapter(recipe_urls), "strawberry")
+        
+        self.assertEqual(
+            [recipe['source_url'] for recipe in recipes],
+            [
+                "https://recipes.example.com/jam-0",
+                "https://recipes.example.com/jam-1",
+                "https://recipes.example.com/jam-2",
+            ]
+        )
+        fetched_urls = [url for _, url in self.scraper.session.requests if 'recipes.' in url.lower()]
+        self.assertEqual(len(fetched_urls), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
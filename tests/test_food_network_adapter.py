@@ -0,0 +1,78 @@
+"""
+Regression tests for FoodNetworkAdapter link and recipe extraction.
+"""
+
+import json
+import unittest
+
+from bs4 import BeautifulSoup
+
+from scraper.adapters.food_network_adapter import FoodNetworkAdapter
+
+
+class RecipeHrefScanTest(unittest.TestCase):
+    """The raw-HTML link scan must agree with the a[href*="/recipes/"] selector."""
+    
+    def setUp(self):
+        self.adapter = FoodNetworkAdapter()
+    
+    def test_ignores_data_href(self):
+        html = '<a data-href="/recipes/nope" href="/other">Nope</a>'
+        self.assertEqual(self.adapter.get_recipe_urls(html), [])
+    
+    def test_skips_gt_inside_attribute_values(self):
+        # Checked on the scan itself: get_recipe_urls would hide a miss by
+        # falling back to the parsed page
+        html = '<a title="Jam > jelly" href="/recipes/food-network-kitchen/fig-jam">Fig Jam</a>'
+        self.assertEqual(
+            self.adapter._scan_recipe_hrefs(html),
+            ['/recipes/food-network-kitchen/fig-jam']
+        )
+
+
+class JsonLdRecipeTest(unittest.TestCase):
+    """The JSON-LD fast path must return what the HTML path would."""
+    
+    CORE_JSON_LD = {
+        '@type': 'Recipe',
+        'name': 'Strawberry Jam',
+        'recipeIngredient': ['2 lb strawberries', '4 cups sugar'],
+        'recipeInstructions': 'Crush the berries.\nBoil with sugar.',
+        'aggregateRating': {'ratingValue': '4.5', 'ratingCount': '12'},
+    }
+    
+    def setUp(self):
+        self.adapter = FoodNetworkAdapter()
+    
+    def _recipe_page(self, recipe_json_ld, body=''):
+        return (
+            '<html><head><script type="application/ld+json">'
+            f'{json.dumps(recipe_json_ld)}</script></head>'
+            f'<body>{body}</body></html>'
+        )
+    
+    def test_optional_fields_fall_back_to_html(self):
+        body = (
+            '<div class="recipe-yield">Makes 3 jars</div>'
+            '<div class="recipe-image"><img src="https://img/h.jpg"></div>'
+            '<p class="p-summary">Summary jam</p>'
+        )
+        recipe = self.adapter.extract_recipe_data(
+            self._recipe_page(self.CORE_JSON_LD, body), 'https://example.com/recipes/jam'
+        )
+        self.assertEqual(recipe['title'], 'Strawberry Jam')
+        self.assertEqual(recipe['servings'], 3)
+        self.assertEqual(recipe['image_url'], 'https://img/h.jpg')
+        self.assertEqual(recipe['description'], 'Summary jam')
+    
+    def test_description_entities_decoded_on_html_path(self):
+        soup = BeautifulSoup('<p class="p-summary">Other</p>', 'html.parser')
+        recipe_json_ld = dict(self.CORE_JSON_LD, description='Jam &amp; toast')
+        self.assertEqual(
+            self.adapter._extract_description(soup, recipe_json_ld),
+            'Jam & toast'
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+"""
+Tests for priority-ordered CSS selector groups.
+"""
+
+import unittest
+
+from bs4 import BeautifulSoup
+
+from scraper.core.selector_groups import compile_selector_group, select_by_priority
+
+
+# The fallback selector's element comes first in the document
+PAGE = (
+    '<div class="fallback">Fallback one</div>'
+    '<h1 class="preferred">Preferred</h1>'
+    '<div class="fallback">Fallback two</div>'
+)
+
+TITLE_SELECTORS = compile_selector_group([
+    '.missing',
+    '.preferred',
+    '.fallback',
+])
+
+
+class SelectByPriorityTest(unittest.TestCase):
+    """select_by_priority must agree with trying soup.select() per selector."""
+    
+    def setUp(self):
+        self.soup = BeautifulSoup(PAGE, 'html.parser')
+    
+    def test_earlier_selector_wins_over_document_order(self):
+        matches = [
+            [elem.get_text() for elem in elems]
+            for elems in select_by_priority(self.soup, TITLE_SELECTORS)
+        ]
+        self.assertEqual(matches, [['Preferred'], ['Fallback one', 'Fallback two']])
+    
+    def test_matches_per_selector_soup_select(self):
+        for selector, elems in zip(['.preferred', '.fallback'], select_by_priority(self.soup, TITLE_SELECTORS)):
+            self.assertEqual(elems, self.soup.select(selector))
+    
+    def test_with_selectors_reports_winning_selector(self):
+        selector, elems = next(select_by_priority(self.soup, TITLE_SELECTORS, with_selectors=True))
+        self.assertEqual(selector, '.preferred')
+        self.assertEqual([elem.get_text() for elem in elems], ['Preferred'])
+    
+    def test_no_matches_yields_nothing(self):
+        soup = BeautifulSoup('<p>Nothing here</p>', 'html.parser')
+        self.assertEqual(list(select_by_priority(soup, TITLE_SELECTORS)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+"""
+Regression tests for SeriousEatsAdapter rating extraction.
+"""
+
+import unittest
+
+from bs4 import BeautifulSoup
+
+from scraper.adapters.serious_eats_adapter import SeriousEatsAdapter
+
+
+class RatingInfoTest(unittest.TestCase):
+    """JSON-LD ratings are read the way the original adapter read them."""
+    
+    def setUp(self):
+        self.adapter = SeriousEatsAdapter()
+    
+    def test_last_rating_block_wins(self):
+        page = (
+            '<script type="application/ld+json">{"@type": "BreadcrumbList"}</script>'
+            '<script type="application/ld+json">'
+            '{"@type": "Recipe", "aggregateRating": {"ratingValue": "4.2", "ratingCount": "10"}}'
+            '</script>'
+            '<script type="application/ld+json">'
+            '{"@type": "Recipe", "aggregateRating": {"ratingValue": "4.8", "ratingCount": "25"}}'
+            '</script>'
+        )
+        soup = BeautifulSoup(page, 'html.parser')
+        self.assertEqual(self.adapter._extract_rating_info(soup), (4.8, 25))
+
+
+if __name__ == '__main__':
+    unittest.main()